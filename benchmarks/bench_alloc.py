@@ -0,0 +1,103 @@
+"""Check the per-tick allocation budget of the game loop with tracemalloc.
+
+Warms a seeded headless match up to a steady state, then measures the peak
+memory allocated while running each tick: the simulation (update_game) and
+the rendering (build_game_frame, not counting the returned frame string,
+which has to be created). Any call measures at about 64 bytes here due to
+tracemalloc itself, and a steady-state tick sits just above that floor
+(about 104 bytes simulating, 72 rendering), so the check gates on the
+median per-tick allocation of each part, with budgets a few bytes over the
+floor; one more object kept per tick already goes over. The mean, which
+includes spikes from events such as particles spawned on a paddle hit,
+has a looser budget of its own.
+
+Only the peak is measured: objects allocated and freed again within the
+tick (temporaries, or a list shifted with pop(0)) are not counted beyond
+the largest number alive at once, so churn of that kind can stay under
+budget.
+
+Needs Python 3.9+ for tracemalloc.reset_peak(). Clearing the traces
+before each call, the only alternative on older versions, reports the
+render path at several times its real cost, so there the check reports
+itself as skipped instead.
+
+    python benchmarks/bench_alloc.py [--ticks N]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from console_pong import headless  # noqa: E402
+
+
+def measure(fn):
+    # Peak bytes allocated while fn runs, not counting a returned string
+    result = None
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    size = peak - before
+    if isinstance(result, str):
+        size -= sys.getsizeof(result)
+    return max(size, 0)
+
+
+def summarize(sizes):
+    sizes.sort()
+    return sum(sizes) / len(sizes), sizes[len(sizes) // 2], sizes[int(len(sizes) * 0.99)], sizes[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--sim-budget", type=int, default=112,
+                        help="median bytes allowed per simulation tick (default: 112)")
+    parser.add_argument("--render-budget", type=int, default=80,
+                        help="median bytes allowed per rendered frame (default: 80)")
+    parser.add_argument("--mean-budget", type=int, default=256,
+                        help="mean bytes allowed per tick for either part (default: 256)")
+    args = parser.parse_args()
+
+    if not hasattr(tracemalloc, "reset_peak"):
+        print("skipped: the allocation check needs Python 3.9 or newer")
+        return 0
+
+    game = headless.new_game(seed=1)
+    for _ in range(args.warmup):
+        headless.step(game)
+        game.build_game_frame()
+
+    def simulate():
+        headless.step(game)
+        if game.game_over:
+            game.init_game()
+
+    sim = []
+    render = []
+    tracemalloc.start()
+    for _ in range(args.ticks):
+        sim.append(measure(simulate))
+        render.append(measure(game.build_game_frame))
+    tracemalloc.stop()
+    sim = summarize(sim)
+    render = summarize(render)
+
+    failed = False
+    for name, stats, budget in (("simulate", sim, args.sim_budget), ("render", render, args.render_budget)):
+        mean, median, p99, worst = stats
+        over = median > budget or mean > args.mean_budget
+        status = "OVER BUDGET" if over else "ok"
+        print(f"{name:>9}: mean {mean:8.1f} B/tick  median {median:6d}  p99 {p99:6d}  max {worst:6d}"
+              f"  (budget {budget}, mean {args.mean_budget}) {status}")
+        if over:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Measure match history writes and leaderboard queries at scale.
+
+Fills a fresh database with synthetic results in batches, the same way
+headless runs do, then times the queries behind the leaderboard screen.
+Also times record(), the only part that runs inside the game loop.
+Exits non-zero if any query takes longer than the budget on average.
+
+    python benchmarks/bench_history.py [--rows N] [--budget MS]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from console_pong import headless  # noqa: E402
+from console_pong.history import MatchHistory  # noqa: E402
+
+
+def synthetic_rows(count, seed=0):
+    rng = random.Random(seed)
+    now = time.time()
+    for i in range(count):
+        mode = "CPU" if rng.random() < 0.7 else "PVP"
+        difficulty = rng.randint(1, 3) if mode == "CPU" else 0
+        winner = rng.randint(1, 2)
+        loser_score = rng.randint(0, 6)
+        p1_score, p2_score = (7, loser_score) if winner == 1 else (loser_score, 7)
+        rallies = p1_score + p2_score
+        yield (now - count + i, mode, difficulty, p1_score, p2_score, winner,
+               rallies, rng.randint(1, 60), rng.uniform(30.0, 600.0))
+
+
+def time_query(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--budget", type=float, default=5.0,
+                        help="mean milliseconds allowed per query (default: 5)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = MatchHistory(os.path.join(tmp, "history.db"), batch_size=args.batch)
+
+        start = time.perf_counter()
+        for row in synthetic_rows(args.rows):
+            history.add(row)
+        history.flush()
+        elapsed = time.perf_counter() - start
+        print(f"insert: {args.rows} rows in {elapsed:.1f}s ({args.rows / elapsed:.0f} rows/s, "
+              f"batches of {args.batch})")
+
+        game = headless.new_game(seed=1)
+        headless.play_match(game)
+        recorder = MatchHistory(os.path.join(tmp, "record.db"), batch_size=1 << 30)
+        count = 100000
+        start = time.perf_counter()
+        for _ in range(count):
+            recorder.record(game)
+        per_record = (time.perf_counter() - start) / count * 1e6
+        recorder.pending.clear()
+        recorder.close()
+        print(f"record: {per_record:.2f} us per finished match (in the game loop)")
+
+        queries = (
+            ("totals", history.totals),
+            ("top rallies", lambda: history.top_rallies(5)),
+            ("top rallies (CPU Hard)", lambda: history.top_rallies(5, "CPU", 3)),
+            ("recent", lambda: history.recent(5)),
+            ("leaderboard screen", history.leaderboard),
+        )
+        failed = False
+        for name, fn in queries:
+            ms = time_query(fn, args.repeats)
+            status = "ok" if ms <= args.budget else "OVER BUDGET"
+            print(f"{name:>24}: {ms:7.3f} ms  (budget {args.budget:g}) {status}")
+            if ms > args.budget:
+                failed = True
+        history.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Measure cold start: time from process launch to the first menu frame.
+
+Starts the game on a pseudo-terminal, as a user would from a shell, and
+times how long it takes until the menu is on screen, then quits it with
+'q'. A bare `python -c pass` is timed the same way as the interpreter's own
+startup baseline. Also times `import console_pong` on its own. Exits
+non-zero if the median time to the first frame exceeds the baseline by more
+than the budget. Bytecode caching is left on, as in an installed package;
+the untimed first run of each command compiles it. POSIX only.
+
+    python benchmarks/bench_startup.py [--runs N] [--budget MS]
+"""
+import argparse
+import os
+import pty
+import select
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+MENU_MARKER = "CONSOLE EDITION".encode()
+
+
+def launch(args, env, marker=None, timeout=10.0):
+    # Seconds until marker appears on the terminal (or until exit if None)
+    master, slave = pty.openpty()
+    start = time.perf_counter()
+    proc = subprocess.Popen(args, stdin=slave, stdout=slave, stderr=slave, env=env, close_fds=True)
+    os.close(slave)
+    output = b""
+    elapsed = None
+    try:
+        deadline = start + timeout
+        while time.perf_counter() < deadline:
+            ready = select.select([master], [], [], 0.01)[0]
+            if ready:
+                try:
+                    chunk = os.read(master, 65536)
+                except OSError:
+                    chunk = b""
+                output += chunk
+                if marker is not None and marker in output:
+                    elapsed = time.perf_counter() - start
+                    os.write(master, b"q")
+                    break
+            if proc.poll() is not None:
+                if marker is None:
+                    elapsed = time.perf_counter() - start
+                break
+        proc.wait(timeout)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        os.close(master)
+    if elapsed is None:
+        raise RuntimeError(f"{' '.join(args)} did not reach the expected output:\n{output[-500:]!r}")
+    return elapsed
+
+
+def median_ms(fn, runs):
+    fn()
+    return statistics.median(fn() for _ in range(runs)) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=18.0,
+                        help="milliseconds allowed over a bare interpreter start (default: 18)")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=SRC, TERM=os.environ.get("TERM", "xterm"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    with tempfile.TemporaryDirectory() as tmp:
+        # A plain `pong`, with its default history database in a scratch home
+        env["HOME"] = tmp
+        baseline = median_ms(lambda: launch([sys.executable, "-c", "pass"], env), args.runs)
+        imported = median_ms(lambda: launch([sys.executable, "-c", "import console_pong"], env), args.runs)
+        first_frame = median_ms(lambda: launch([sys.executable, "-m", "console_pong"], env, MENU_MARKER), args.runs)
+
+    overhead = first_frame - baseline
+    status = "ok" if overhead <= args.budget else "OVER BUDGET"
+    print(f"     python -c pass: {baseline:7.1f} ms")
+    print(f"import console_pong: {imported:7.1f} ms  ({imported - baseline:+.1f})")
+    print(f"   first menu frame: {first_frame:7.1f} ms  ({overhead:+.1f}, budget {args.budget:g}) {status}")
+    return 0 if overhead <= args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Measure the cost of event telemetry on the game tick.
+
+Plays the same seeded headless matches (simulation plus frame rendering, as
+in the live loop) with and without telemetry, and times record() on its
+own. The budget is checked against the hot path cost per tick, i.e. events
+per tick times the cost of one record(), relative to the tick time. The
+end-to-end timings are printed too but are too noisy to gate on.
+Flushing happens in the idle part of a live frame and is reported
+separately. Exits non-zero if the budget is exceeded.
+
+    python benchmarks/bench_telemetry.py [--matches N] [--budget PCT]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from console_pong import headless  # noqa: E402
+from console_pong.telemetry import Telemetry, ColumnarSink, NdjsonSink, EV_PADDLE_HIT  # noqa: E402
+
+
+def run_matches(matches, make_telemetry=None):
+    ticks = 0
+    events = 0
+    elapsed = 0.0
+    flushing = 0.0
+    for seed in range(matches):
+        game = headless.new_game(seed=seed)
+        telemetry = None
+        if make_telemetry is not None:
+            telemetry = make_telemetry()
+            game.telemetry = telemetry
+        start = time.perf_counter()
+        while not game.game_over:
+            headless.step(game)
+            game.build_game_frame()
+            ticks += 1
+            if telemetry is not None and telemetry.should_flush():
+                flush_start = time.perf_counter()
+                telemetry.flush()
+                flushing += time.perf_counter() - flush_start
+        elapsed += time.perf_counter() - start
+        if telemetry is not None:
+            flush_start = time.perf_counter()
+            telemetry.close()
+            flushing += time.perf_counter() - flush_start
+            events += telemetry.head
+    return ticks, events, elapsed - flushing, flushing
+
+
+def bench_record(n=1000000):
+    class NullSink:
+        def write_block(self, columns):
+            pass
+
+        def close(self):
+            pass
+
+    telemetry = Telemetry(NullSink())
+    record = telemetry.record
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(n):
+            record(EV_PADDLE_HIT, i, 1, 3.0, 10.0, 4.0)
+        per_call = (time.perf_counter() - start) / n
+        if best is None or per_call < best:
+            best = per_call
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="allowed hot path overhead per tick in percent (default: 1)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sinks = {
+            "off": None,
+            "columnar": lambda: Telemetry(ColumnarSink(os.path.join(tmp, "events.ptel"))),
+            "ndjson": lambda: Telemetry(NdjsonSink(os.path.join(tmp, "events.ndjson"))),
+        }
+        # Interleave the variants and keep the best run of each, so machine
+        # noise does not land on one variant only
+        results = {}
+        flushes = {}
+        for _ in range(args.repeat):
+            for name, make in sinks.items():
+                ticks, n, elapsed, flushing = run_matches(args.matches, make)
+                if n:
+                    events = n
+                if name not in results or elapsed / ticks < results[name]:
+                    results[name] = elapsed / ticks
+                    flushes[name] = flushing / ticks
+        for name in sinks:
+            print(f"{name:>9}: {results[name] * 1e6:8.2f} us/tick, flush {flushes[name] * 1e6:6.2f} us/tick")
+
+    per_record = bench_record()
+    per_tick = events / ticks * per_record
+    overhead = per_tick / results["off"] * 100
+    print(f"   events: {events} in {ticks} ticks ({events / ticks:.3f}/tick)")
+    print(f"   record: {per_record * 1e9:8.1f} ns/event")
+    print(f" hot path: {per_tick * 1e9:8.1f} ns/tick = {overhead:.3f}% of a tick (budget {args.budget:.1f}%)")
+    return 1 if overhead > args.budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,95 @@
-from .game import PongGame
+import sys
 
+# Kept light: importing the package loads nothing else. The game module,
+# argparse and optional features are imported when main() needs them.
 
-def main():
+
+def __getattr__(name):
+    if name == "PongGame":
+        from .game import PongGame
+        return PongGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+OPTIONS = (
+    ("--bot", dict(metavar="NAME",
+                   help="publish game state to shared memory NAME and let an external bot drive a paddle")),
+    ("--bot-player", dict(type=int, choices=(1, 2), default=2,
+                          help="paddle driven by the bot (default: 2)")),
+    ("--telemetry", dict(metavar="PATH",
+                         help="record game events to PATH (.ndjson for JSON lines, otherwise columnar)")),
+    ("--fixed-point", dict(action="store_true",
+                           help="use integer ball physics, bit-exact across machines")),
+    ("--cast", dict(metavar="PATH",
+                    help="record the session to PATH as an asciicast v2 file")),
+    ("--history", dict(metavar="PATH",
+                       help="match history database (default: ~/.console_pong/history.db)")),
+    ("--no-history", dict(action="store_true",
+                          help="do not record finished matches")),
+)
+
+
+def default_args():
+    # What parse_args([]) returns, without loading argparse
+    from types import SimpleNamespace
+    args = SimpleNamespace()
+    for flag, options in OPTIONS:
+        default = False if options.get("action") == "store_true" else options.get("default")
+        setattr(args, flag[2:].replace("-", "_"), default)
+    return args
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        return default_args()
+
+    import argparse
+    parser = argparse.ArgumentParser(prog="pong", description="A fully featured Pong game right in your terminal")
+    for flag, options in OPTIONS:
+        parser.add_argument(flag, **options)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from .game import PongGame
     game = PongGame()
-    game.run()
+    game.fixed_point = args.fixed_point
+
+    channel = None
+    if args.bot:
+        from .bot import BotChannel
+        channel = BotChannel(args.bot)
+        game.attach_bot(channel, args.bot_player)
+
+    if args.telemetry:
+        from .telemetry import Telemetry, open_sink
+        game.telemetry = Telemetry(open_sink(args.telemetry))
+
+    if args.cast:
+        from .asciicast import open_cast
+        game.recorder = open_cast(args.cast, game)
+
+    if not args.no_history:
+        from .history import DEFAULT_PATH, MatchHistory
+        # Opened on first use. Short lock timeout: waiting on another
+        # writer must not stall a frame
+        game.history = MatchHistory(args.history or DEFAULT_PATH, timeout=0.02)
+
+    try:
+        game.run()
+    finally:
+        if channel is not None:
+            channel.close()
+        if game.telemetry is not None:
+            game.telemetry.close()
+        if game.history is not None:
+            from .history import HistoryError
+            try:
+                game.history.close()
+            except HistoryError as e:
+                print(f"  Could not save match history: {e}")
+        if game.recorder is not None:
+            game.recorder.close()
@@ -0,0 +1,94 @@
+import json
+import time
+
+# Asciicast v2 recording
+#
+# Frames are streamed to the file as they are rendered, so a recording of
+# any length needs only the previous frame in memory. The first frame is
+# drawn in full; after that each event holds just the rows that changed,
+# each one moved to with a cursor position escape and cleared to the end
+# of the line. Events are buffered and written in bulk by flush(), which
+# the main loop calls in idle frame time; frame() only writes by itself if
+# the buffer grows past max_buffer.
+#
+# Timestamps come from clock, so a headless match recorded on a SimClock
+# plays back at normal speed however fast it was simulated.
+
+
+class AsciicastWriter:
+    def __init__(self, path, width=80, height=40, clock=time.time, title=None,
+                 buffer_size=1 << 16, max_buffer=1 << 20):
+        self.file = open(path, "w", encoding="utf-8", newline="\n")
+        self.width = width
+        self.height = height
+        self.clock = clock
+        self.title = title
+        self.buffer_size = buffer_size
+        self.max_buffer = max_buffer
+        self.pending = []
+        self.pending_size = 0
+        self.start = None
+        self.lines = []
+        self.events = 0
+
+    def write_header(self, now):
+        header = {
+            "version": 2,
+            "width": self.width,
+            "height": self.height,
+            "timestamp": int(time.time()),
+            "env": {"TERM": "xterm-256color"},
+        }
+        if self.title:
+            header["title"] = self.title
+        self.pending.append(json.dumps(header) + "\n")
+        self.start = now
+
+    def frame(self, text):
+        now = self.clock()
+        if self.start is None:
+            self.write_header(now)
+            parts = ["\033[?25l\033[2J"]
+        else:
+            parts = []
+
+        lines = text.split("\n")
+        prev = self.lines
+        for row, line in enumerate(lines):
+            if row >= len(prev) or prev[row] != line:
+                parts.append(f"\033[{row + 1};1H{line}\033[K")
+        for row in range(len(lines), len(prev)):
+            parts.append(f"\033[{row + 1};1H\033[K")
+        self.lines = lines
+        if not parts:
+            return
+
+        event = json.dumps([round(now - self.start, 6), "o", "".join(parts)], ensure_ascii=False) + "\n"
+        self.pending.append(event)
+        self.pending_size += len(event)
+        self.events += 1
+        if self.pending_size >= self.max_buffer:
+            self.flush()
+
+    def should_flush(self):
+        return self.pending_size >= self.buffer_size
+
+    def flush(self):
+        if not self.pending:
+            return 0
+        size = self.pending_size
+        self.file.write("".join(self.pending))
+        self.pending.clear()
+        self.pending_size = 0
+        return size
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def open_cast(path, game, title="PONG"):
+    # Sized to fit every screen of the game, timed by the game's clock
+    width = max(64, game.width + 4)
+    height = max(34, game.height + 12)
+    return AsciicastWriter(path, width, height, clock=game.clock, title=title)
@@ -0,0 +1,268 @@
+import struct
+import time
+from collections import namedtuple
+
+from .powerups import POWERUP_CODES
+
+# Shared memory bot protocol
+#
+# The game owns a small shared memory region and republishes its state into
+# it every tick. External bot processes attach to the region by name, read
+# the state straight out of the buffer and write their paddle command back
+# into the same region. Both directions are guarded by a sequence counter
+# (seqlock): the writer makes the counter odd while it is writing and even
+# again when it is done, readers retry if the counter was odd or changed
+# under them.
+#
+#   offset  0  header   magic, version, state sequence
+#   offset 16  state    see STATE_FIELDS
+#   offset ..  command  command sequence, state sequence acted on, move
+#
+# Of the active powerup effects only the most recently collected one is
+# published (powerup_active, its owner and the ticks it has left).
+#
+# The game publishes every frame in every state. FLAG_NOT_PLAYING is set on
+# the menus and the game over screen, and FLAG_CLOSED once the game exits.
+
+MAGIC = 0x504F4E47  # "PONG"
+VERSION = 1
+
+HEADER = struct.Struct("<IIQ")
+STATE = struct.Struct("<Q5d2d2i2i2i3i3i2i")
+COMMAND = struct.Struct("<QQi")
+
+STATE_OFFSET = HEADER.size
+COMMAND_OFFSET = STATE_OFFSET + STATE.size
+
+# flags is the last state field
+FLAGS = struct.Struct("<i")
+FLAGS_OFFSET = COMMAND_OFFSET - FLAGS.size
+REGION_SIZE = COMMAND_OFFSET + COMMAND.size
+
+STATE_FIELDS = (
+    "tick",
+    "ball_x", "ball_y", "ball_dx", "ball_dy", "ball_speed",
+    "p1_y", "p2_y",
+    "paddle_h", "paddle_h_p2",
+    "width", "height",
+    "p1_score", "p2_score",
+    "powerup_x", "powerup_y", "powerup_type",
+    "powerup_active", "powerup_active_owner", "powerup_active_timer",
+    "countdown", "flags",
+)
+
+BotState = namedtuple("BotState", STATE_FIELDS)
+
+FLAG_PAUSED = 1
+FLAG_GAME_OVER = 2
+FLAG_NOT_PLAYING = 4
+FLAG_CLOSED = 8
+
+MOVE_UP = -1
+MOVE_STAY = 0
+MOVE_DOWN = 1
+
+
+def _shared_memory():
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        raise RuntimeError("bot support needs Python 3.8 or newer")
+    return shared_memory
+
+
+class BotChannel:
+    """Game side of the bot protocol. Creates and owns the region."""
+
+    def __init__(self, name=None):
+        shared_memory = _shared_memory()
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=REGION_SIZE)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.seq = 0
+        self.last_command_seq = 0
+        COMMAND.pack_into(self.buf, COMMAND_OFFSET, 0, 0, MOVE_STAY)
+        HEADER.pack_into(self.buf, 0, MAGIC, VERSION, self.seq)
+
+    def publish(self, game, tick):
+        flags = 0
+        if game.paused:
+            flags |= FLAG_PAUSED
+        if game.game_over:
+            flags |= FLAG_GAME_OVER
+        if game.state != "PLAYING":
+            flags |= FLAG_NOT_PLAYING
+
+        active = active_owner = active_ticks = 0
+        if game.active_effects:
+            effect = next(reversed(game.active_effects.values()))
+            active = effect.powerup.code
+            active_owner = effect.owner
+            active_ticks = effect.expires - game.tick
+
+        buf = self.buf
+        self.seq += 1
+        HEADER.pack_into(buf, 0, MAGIC, VERSION, self.seq)
+        STATE.pack_into(
+            buf, STATE_OFFSET,
+            tick,
+            game.ball_x, game.ball_y, game.ball_dx, game.ball_dy, game.ball_speed,
+            game.p1_y, game.p2_y,
+            game.paddle_h, game.paddle_h_p2,
+            game.width, game.height,
+            game.p1_score, game.p2_score,
+            game.powerup_x, game.powerup_y, POWERUP_CODES.get(game.powerup_type, 0),
+            active, active_owner, active_ticks,
+            game.countdown, flags,
+        )
+        self.seq += 1
+        HEADER.pack_into(buf, 0, MAGIC, VERSION, self.seq)
+
+    def read_command(self):
+        # Returns the latest move, or None if the bot has not sent anything
+        # new (or is halfway through writing it) since the last call.
+        seq, _, move = COMMAND.unpack_from(self.buf, COMMAND_OFFSET)
+        if seq & 1 or seq == self.last_command_seq:
+            return None
+        if COMMAND.unpack_from(self.buf, COMMAND_OFFSET)[0] != seq:
+            return None
+        self.last_command_seq = seq
+        return move
+
+    def close(self):
+        # Tell attached bots the game is gone before removing the region
+        buf = self.buf
+        flags = FLAGS.unpack_from(buf, FLAGS_OFFSET)[0]
+        self.seq += 1
+        HEADER.pack_into(buf, 0, MAGIC, VERSION, self.seq)
+        FLAGS.pack_into(buf, FLAGS_OFFSET, flags | FLAG_CLOSED)
+        self.seq += 1
+        HEADER.pack_into(buf, 0, MAGIC, VERSION, self.seq)
+
+        self.buf = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+class BotClient:
+    """Bot side of the bot protocol. Attaches to a region created by the game."""
+
+    def __init__(self, name, timeout=10.0):
+        shared_memory = _shared_memory()
+        deadline = time.time() + timeout
+        while True:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name)
+                break
+            except FileNotFoundError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+        self._untrack(self.shm)
+        self.name = name
+        self.buf = self.shm.buf
+        magic, version, _ = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.shm.close()
+            raise RuntimeError(f"{name} is not a pong bot region (version {version})")
+        self.command_seq = 0
+
+    def _untrack(self, shm):
+        # The attaching process must not unlink the region when it exits,
+        # only the game that created it does.
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+
+    def region_exists(self):
+        # False once the game has unlinked the region (also after a crash)
+        try:
+            shm = _shared_memory().SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return False
+        self._untrack(shm)
+        shm.close()
+        return True
+
+    def read_state(self):
+        # Returns (seq, BotState) for a consistent snapshot
+        buf = self.buf
+        while True:
+            seq = HEADER.unpack_from(buf, 0)[2]
+            if seq & 1:
+                continue
+            values = STATE.unpack_from(buf, STATE_OFFSET)
+            if HEADER.unpack_from(buf, 0)[2] == seq:
+                return seq, BotState(*values)
+
+    def wait_state(self, last_seq, timeout=None, spin=0.0002):
+        # Blocks until the game publishes a state newer than last_seq
+        deadline = None if timeout is None else time.time() + timeout
+        buf = self.buf
+        while True:
+            seq = HEADER.unpack_from(buf, 0)[2]
+            if seq != last_seq and not seq & 1:
+                seq, state = self.read_state()
+                if seq != last_seq:
+                    return seq, state
+            if deadline is not None and time.time() > deadline:
+                return None, None
+            if spin:
+                time.sleep(spin)
+
+    def send(self, move, state_seq=0):
+        buf = self.buf
+        self.command_seq += 1
+        COMMAND.pack_into(buf, COMMAND_OFFSET, self.command_seq, state_seq, move)
+        self.command_seq += 1
+        COMMAND.pack_into(buf, COMMAND_OFFSET, self.command_seq, state_seq, move)
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+
+# ── Example bot ──────────────────────────────────────────
+
+def tracking_bot(name, player=2):
+    client = BotClient(name)
+    seq = 0
+    try:
+        # Runs until the game exits, through menus and rematches
+        while True:
+            new_seq, state = client.wait_state(seq, timeout=1.0)
+            if state is None:
+                if not client.region_exists():
+                    break
+                continue
+            seq = new_seq
+            if state.flags & FLAG_CLOSED:
+                break
+            if state.flags & FLAG_NOT_PLAYING:
+                continue
+            if player == 1:
+                center = state.p1_y + state.paddle_h / 2.0
+            else:
+                center = state.p2_y + state.paddle_h_p2 / 2.0
+            diff = state.ball_y - center
+            if diff > 1:
+                client.send(MOVE_DOWN, seq)
+            elif diff < -1:
+                client.send(MOVE_UP, seq)
+            else:
+                client.send(MOVE_STAY, seq)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Example paddle bot for console-pong")
+    parser.add_argument("name", help="shared memory name passed to pong --bot")
+    parser.add_argument("--player", type=int, choices=(1, 2), default=2)
+    args = parser.parse_args()
+    tracking_bot(args.name, args.player)
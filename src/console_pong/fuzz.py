@@ -0,0 +1,309 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .game import PongGame
+from .headless import SimClock
+
+# Physics fuzzer
+#
+# Plays randomized headless games (field size, speeds, paddle inputs,
+# powerups) and checks invariants after every ball step and every tick.
+# A case is a small dict that fully determines a run, so a failing case can
+# be shrunk to a simpler one that still fails and saved as JSON for replay:
+#
+#   python -m console_pong.fuzz --cases 1000 --ticks 5000
+#   python -m console_pong.fuzz --replay fuzz-cases/case-123.json
+
+
+class InvariantError(Exception):
+    def __init__(self, invariant, message):
+        super().__init__(f"{invariant}: {message}")
+        self.invariant = invariant
+        self.message = message
+
+
+DEFAULT_CASE = {
+    "seed": 0,
+    "mode": "CPU",
+    "difficulty": 2,
+    "width": 60,
+    "height": 22,
+    "max_speed": 2.5,
+    "start_speed": 1.0,
+    "input_rate": 0.0,
+    "powerup_rate": 0.0,
+    "fixed_point": False,
+    "ticks": 5000,
+    "max_rally": 1000,
+}
+
+MAX_SHRINK_STEPS = 100
+
+
+def random_case(seed, ticks, max_rally=1000):
+    rng = random.Random(seed)
+    return {
+        "seed": seed,
+        "mode": rng.choice(["CPU", "PVP"]),
+        "difficulty": rng.randint(1, 3),
+        "width": rng.randint(16, 120),
+        "height": rng.randint(8, 40),
+        "max_speed": round(rng.uniform(1.0, 4.0), 3),
+        "start_speed": round(rng.uniform(0.5, 4.0), 3),
+        "input_rate": round(rng.random(), 3),
+        "powerup_rate": rng.choice([0.0, 0.003, 0.02, 0.1]),
+        "fixed_point": rng.random() < 0.5,
+        "ticks": ticks,
+        "max_rally": max_rally,
+    }
+
+
+# ── Invariants ───────────────────────────────────────────
+
+class Checker:
+    def __init__(self, game, max_rally):
+        self.game = game
+        self.max_rally = max_rally
+        self.steps_since_contact = 0
+        self.scores = (0, 0)
+        if game.fixed_point:
+            self.step_ball = game._step_ball_fixed
+            game._step_ball_fixed = self.checked_step
+        else:
+            self.step_ball = game._step_ball
+            game._step_ball = self.checked_step
+
+    def checked_step(self):
+        game = self.game
+        if game.game_over:
+            raise InvariantError("step_after_game_over", "ball moved after the match ended")
+
+        rally = game.current_rally
+        scores = (game.p1_score, game.p2_score)
+        old_x = game.ball_x
+        self.step_ball()
+
+        if (game.p1_score, game.p2_score) != scores:
+            if game.p1_score + game.p2_score != sum(scores) + 1:
+                raise InvariantError("one_point_per_step", f"{scores} -> {game.p1_score}, {game.p2_score}")
+            self.steps_since_contact = 0
+            return
+
+        if game.current_rally != rally:
+            self.steps_since_contact = 0
+        else:
+            self.steps_since_contact += 1
+            if abs(game.ball_x - old_x) > 1.0 + 1e-9:
+                raise InvariantError("tunnelling", f"ball jumped from x={old_x} to x={game.ball_x}")
+        if self.steps_since_contact > 2 * game.width + 10:
+            raise InvariantError("stuck_ball", f"{self.steps_since_contact} steps without a hit or a point")
+
+        self.check_bounds()
+        self.check_paddles()
+
+    def check_bounds(self):
+        game = self.game
+        if not 0 <= game.ball_x < game.width:
+            raise InvariantError("ball_in_bounds", f"x={game.ball_x} outside 0..{game.width}")
+        if not 1 <= game.ball_y <= game.height - 2:
+            raise InvariantError("ball_in_bounds", f"y={game.ball_y} outside 1..{game.height - 2}")
+
+    def check_paddles(self):
+        # A ball behind a paddle line, still heading for the goal, must have
+        # missed the paddle.
+        game = self.game
+        by = max(1, min(game.height - 2, int(round(game.ball_y))))
+        if game.ball_x <= 2 and game.ball_dx < 0:
+            top = int(game.p1_y)
+            if top <= by < top + game.paddle_h:
+                raise InvariantError("tunnelling", f"ball passed through P1 paddle at row {by}")
+        if game.ball_x >= game.width - 3 and game.ball_dx > 0:
+            top = int(game.p2_y)
+            if top <= by < top + game.paddle_h_p2:
+                raise InvariantError("tunnelling", f"ball passed through P2 paddle at row {by}")
+
+    def check_tick(self):
+        game = self.game
+        scores = (game.p1_score, game.p2_score)
+        if scores[0] < self.scores[0] or scores[1] < self.scores[1]:
+            raise InvariantError("scores_monotonic", f"{self.scores} -> {scores}")
+        if max(scores) > game.win_score:
+            raise InvariantError("scores_monotonic", f"score {scores} past win score {game.win_score}")
+        if game.current_rally > self.max_rally:
+            raise InvariantError("infinite_rally", f"rally of {game.current_rally} hits")
+        self.scores = scores
+
+    def new_match(self):
+        self.scores = (0, 0)
+        self.steps_since_contact = 0
+
+
+# ── Running Cases ────────────────────────────────────────
+
+def run_case(case):
+    # Returns None if the case passes, else a failure dict
+    case = dict(DEFAULT_CASE, **case)
+    random.seed(case["seed"])
+    inputs = random.Random(case["seed"] ^ 0x5EED)
+
+    game = PongGame()
+    game.clock = SimClock(game.tick_rate)
+    game.width = case["width"]
+    game.height = case["height"]
+    game.max_speed = case["max_speed"]
+    game.mode = case["mode"]
+    game.cpu_difficulty = case["difficulty"]
+    game.fixed_point = case["fixed_point"]
+    game.state = "PLAYING"
+    game.init_game()
+    game.set_ball_speed(min(case["start_speed"], game.max_speed))
+    checker = Checker(game, case["max_rally"])
+
+    players = (1,) if case["mode"] == "CPU" else (1, 2)
+    tick = 0
+    try:
+        for tick in range(case["ticks"]):
+            for player in players:
+                if inputs.random() < case["input_rate"]:
+                    game.move_paddle(player, inputs.choice((-1, 1)))
+            if game.powerup_x < 0 and inputs.random() < case["powerup_rate"]:
+                game.spawn_powerup()
+
+            game.update_game()
+            game.clock.advance()
+            checker.check_tick()
+
+            if game.game_over:
+                game.init_game()
+                game.set_ball_speed(min(case["start_speed"], game.max_speed))
+                checker.new_match()
+    except InvariantError as e:
+        return {"tick": tick, "invariant": e.invariant, "message": e.message}
+    return None
+
+
+def shrink(case, failure):
+    # Greedily simplify the case while it keeps failing the same invariant.
+    # Any change shifts the random stream, so candidates get the full tick
+    # budget; only at the end is the run cut off just after the failure.
+    # The field only ever gets smaller and no case is tried twice, so this
+    # ends; MAX_SHRINK_STEPS bounds it all the same.
+    invariant = failure["invariant"]
+    tried = set()
+
+    def candidates(c):
+        yield dict(c, powerup_rate=0.0)
+        yield dict(c, input_rate=0.0)
+        yield dict(c, mode="CPU")
+        yield dict(c, fixed_point=False)
+        yield dict(c, start_speed=1.0)
+        yield dict(c, max_speed=DEFAULT_CASE["max_speed"])
+        if DEFAULT_CASE["width"] <= c["width"] and DEFAULT_CASE["height"] <= c["height"]:
+            yield dict(c, width=DEFAULT_CASE["width"], height=DEFAULT_CASE["height"])
+        if c["width"] > 16:
+            yield dict(c, width=max(16, c["width"] // 2))
+        if c["height"] > 8:
+            yield dict(c, height=max(8, c["height"] // 2))
+
+    changed = True
+    steps = 0
+    while changed and steps < MAX_SHRINK_STEPS:
+        changed = False
+        steps += 1
+        for candidate in candidates(case):
+            key = tuple(sorted(candidate.items()))
+            if candidate == case or key in tried:
+                continue
+            tried.add(key)
+            result = run_case(candidate)
+            if result is not None and result["invariant"] == invariant:
+                case = candidate
+                failure = result
+                changed = True
+                break
+
+    # A run is a prefix of any longer run with the same case, so this
+    # fails at the same tick
+    return dict(case, ticks=failure["tick"] + 1), failure
+
+
+def run_batch(first_seed, count, ticks, max_rally):
+    failures = []
+    total = 0
+    for seed in range(first_seed, first_seed + count):
+        case = random_case(seed, ticks, max_rally)
+        failure = run_case(case)
+        if failure is None:
+            total += ticks
+        else:
+            total += failure["tick"] + 1
+            failures.append((case, failure))
+    return total, failures
+
+
+def save_case(out_dir, case, failure):
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"case-{case['seed']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"case": case, "failure": failure}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m console_pong.fuzz", description="Fuzz the ball physics")
+    parser.add_argument("--cases", type=int, default=1000, help="number of random cases (default: 1000)")
+    parser.add_argument("--ticks", type=int, default=5000, help="ticks per case (default: 5000)")
+    parser.add_argument("--seed", type=int, default=0, help="first case seed (default: 0)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--batch", type=int, default=20, help="cases per worker task (default: 20)")
+    parser.add_argument("--max-rally", type=int, default=None,
+                        help="longest allowed rally (default: 1000, or the saved case's on --replay)")
+    parser.add_argument("--out", default="fuzz-cases", help="directory for failing cases (default: fuzz-cases)")
+    parser.add_argument("--replay", metavar="FILE", help="run a saved case instead of fuzzing")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        with open(args.replay, encoding="utf-8") as f:
+            case = json.load(f)["case"]
+        if args.max_rally is not None:
+            case["max_rally"] = args.max_rally
+        failure = run_case(case)
+        if failure is None:
+            print("passed")
+            return 0
+        print(f"failed at tick {failure['tick']}: {failure['invariant']}: {failure['message']}")
+        return 1
+
+    max_rally = DEFAULT_CASE["max_rally"] if args.max_rally is None else args.max_rally
+    start = time.time()
+    total = 0
+    failures = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = []
+        for first in range(args.seed, args.seed + args.cases, args.batch):
+            count = min(args.batch, args.seed + args.cases - first)
+            futures.append(pool.submit(run_batch, first, count, args.ticks, max_rally))
+        for future in futures:
+            ticks, batch_failures = future.result()
+            total += ticks
+            failures.extend(batch_failures)
+
+    elapsed = time.time() - start
+    print(f"{args.cases} cases, {total} ticks in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} ticks/s)")
+
+    for case, failure in failures:
+        case, failure = shrink(case, failure)
+        path = save_case(args.out, case, failure)
+        print(f"FAIL seed {case['seed']} tick {failure['tick']}: {failure['invariant']}: "
+              f"{failure['message']} -> {path}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,46 @@
 import sys
-import os
 import time
 import random
-import math
 
-WINDOWS = os.name == 'nt'
+from .powerups import POWERUPS, POWERUP_NAMES, ActiveEffect, TimerWheel
+from .telemetry import (
+    EV_PADDLE_HIT, EV_WALL_BOUNCE, EV_SCORE,
+    EV_POWERUP_SPAWN, EV_POWERUP_COLLECT, EV_POWERUP_EXPIRE,
+)
+from .history import HistoryError
+from .screens import MENU_ITEMS, MENU_FRAMES, DIFFICULTY_FRAMES, GAME_OVER_TEMPLATE, stats_frame
 
-if WINDOWS:
-    import msvcrt
-else:
-    import tty
-    import termios
-    import select
+CPU_REACT_EVERY = {1: 6, 2: 3, 3: 1}
+CPU_MOVE_SPEED = {1: 1, 2: 2, 3: 2}
+
+HIT_CHARS = ('*', '+', '.', '·', ':', '~')
+WALL_CHARS = ('─', '~', '.')
+SCORE_CHARS = ('★', '!', '*', '●', '◆', '+')
+PICKUP_CHARS = ('★', '✦', '◆', '●')
+TRAIL_SYMS = ('·', '∙', '◦', '○')
+SHAKE_OFFSETS = (-1, 0, 1)
+
+# Fixed-point physics: ball position and velocity in 1/FIXED_ONE cells
+FIXED_ONE = 1000
+FIXED_HALF = FIXED_ONE // 2
+FIXED_MIN_DY = 300
+FIXED_MAX_DY = 900
+FIXED_SPEED_STEP = 80
+
+# Slowest a slowdown powerup can make the ball
+MIN_POWERUP_SPEED = 0.5
+
+
+def to_fixed(value):
+    return int(round(value * FIXED_ONE))
+
+
+def fixed_cell(value):
+    # Cell of a fixed-point coordinate, rounding half to even like round()
+    cell, rest = divmod(value, FIXED_ONE)
+    if rest > FIXED_HALF or (rest == FIXED_HALF and cell & 1):
+        cell += 1
+    return cell
 
 
 class PongGame:
@@ -22,6 +51,7 @@ class PongGame:
         # Paddles
         self.paddle_h = 5
         self.paddle_h_p2 = 5
+        self.paddle_bonus = {1: 0, 2: 0}
         self.p1_y = 0.0
         self.p2_y = 0.0
 
@@ -33,9 +63,28 @@ class PongGame:
         self.ball_speed = 1.0
         self.max_speed = 2.5
 
-        # Trail effect
-        self.ball_trail = []
+        # ball_speed is base_speed (raised by paddle hits) scaled by the
+        # active speed powerups: speed_bonus is their sum in percent
+        self.base_speed = 1.0
+        self.speed_bonus = 0
+
+        # Integer ball state, used instead of the floats above when
+        # fixed_point is set. The floats are then kept as a read-only view.
+        self.fixed_point = False
+        self.fx_x = 0
+        self.fx_y = 0
+        self.fx_dx = 0
+        self.fx_dy = 0
+        self.fx_speed = FIXED_ONE
+        self.fx_base_speed = FIXED_ONE
+        self.fx_accum = 0
+
+        # Trail effect (ring buffer of the last max_trail positions)
         self.max_trail = 4
+        self.trail_x = [0.0] * self.max_trail
+        self.trail_y = [0.0] * self.max_trail
+        self.trail_head = 0
+        self.trail_len = 0
 
         # Particles
         self.particles = []
@@ -57,14 +106,19 @@ class PongGame:
         self.cpu_difficulty = 2
         self.cpu_reaction_timer = 0
 
+        # External bot (see bot.py)
+        self.bot = None
+        self.bot_player = 2
+        self.tick = 0
+
         # Powerups
         self.powerup_x = -1
         self.powerup_y = -1
         self.powerup_type = ""
         self.powerup_timer = 0
-        self.powerup_active = ""
-        self.powerup_active_timer = 0
-        self.powerup_active_owner = 0
+        self.active_effects = {}
+        self.effect_wheel = TimerWheel()
+        self.next_effect_id = 0
 
         # Stats
         self.rallies = 0
@@ -99,34 +153,38 @@ class PongGame:
         self.mode_selection = 0
         self.difficulty_selection = 1
 
-        # Terminal
-        if not WINDOWS:
-            self.old_settings = termios.tcgetattr(sys.stdin)
-            tty.setcbreak(sys.stdin.fileno())
+        # Clock used by game logic; headless runs swap in a simulated one
+        self.clock = time.time
+
+        # Telemetry (see telemetry.py)
+        self.telemetry = None
+
+        # Terminal recording (see asciicast.py)
+        self.recorder = None
+
+        # Match history and leaderboard (see history.py)
+        self.history = None
+        self.stats_frame = ""
+
+        # Reused frame buffers, see build_frame_buffers
+        self.frame_w = 0
+        self.frame_h = 0
+
+        # Terminal backend (see terminal.py), set up by run()
+        self.terminal = None
+
+    def setup_terminal(self):
+        from .terminal import open_terminal
+        self.terminal = open_terminal()
 
     def cleanup(self):
-        if not WINDOWS:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+        if self.terminal is not None:
+            self.terminal.restore()
         sys.stdout.write('\033[?25h')
         sys.stdout.flush()
 
     def get_key(self):
-        if WINDOWS:
-            if msvcrt.kbhit():
-                ch = msvcrt.getch()
-                if ch in (b'\x00', b'\xe0'):
-                    msvcrt.getch()
-                    return None
-                try:
-                    return ch.decode('utf-8').lower()
-                except:
-                    return None
-            return None
-        else:
-            if select.select([sys.stdin], [], [], 0)[0]:
-                ch = sys.stdin.read(1)
-                return ch.lower()
-            return None
+        return self.terminal.get_key()
 
     def read_keys(self):
         keys = []
@@ -145,13 +203,14 @@ class PongGame:
         sys.stdout.write('\033[H')
 
     def clear(self):
-        os.system('cls' if WINDOWS else 'clear')
+        if self.terminal is not None:
+            self.terminal.clear()
 
     # ── Particle System ──────────────────────────────────────
 
     def spawn_particles(self, x, y, count=6, chars=None):
         if chars is None:
-            chars = ['*', '+', '.', '·', ':', '~']
+            chars = HIT_CHARS
         for _ in range(count):
             self.particles.append({
                 'x': float(x),
@@ -163,7 +222,7 @@ class PongGame:
             })
 
     def spawn_score_particles(self, x, y):
-        chars = ['★', '!', '*', '●', '◆', '+']
+        chars = SCORE_CHARS
         for _ in range(12):
             self.particles.append({
                 'x': float(x),
@@ -175,65 +234,80 @@ class PongGame:
             })
 
     def update_particles(self):
-        alive = []
-        for p in self.particles:
+        # Compacts the list in place instead of building a new one
+        particles = self.particles
+        alive = 0
+        for p in particles:
             p['x'] += p['dx']
             p['y'] += p['dy']
             p['life'] -= 1
             p['dy'] += 0.1
             if p['life'] > 0:
-                alive.append(p)
-        self.particles = alive
+                particles[alive] = p
+                alive += 1
+        del particles[alive:]
 
     # ── Power-up System ──────────────────────────────────────
 
     def spawn_powerup(self):
         self.powerup_x = random.randint(self.width // 4, 3 * self.width // 4)
         self.powerup_y = random.randint(2, self.height - 3)
-        self.powerup_type = random.choice(["BIG", "FAST", "SLOW", "TINY"])
+        self.powerup_type = random.choice(POWERUP_NAMES)
         self.powerup_timer = 200
+        if self.telemetry is not None:
+            self.telemetry.record(EV_POWERUP_SPAWN, self.tick, 0, self.powerup_x, self.powerup_y,
+                                  POWERUPS[self.powerup_type].code)
 
     def collect_powerup(self, player):
-        self.powerup_active = self.powerup_type
-        self.powerup_active_timer = 150
-        self.powerup_active_owner = player
-
-        if self.powerup_type == "BIG":
-            if player == 1:
-                self.paddle_h = 7
-            else:
-                self.paddle_h_p2 = 7
-        elif self.powerup_type == "TINY":
-            if player == 1:
-                self.paddle_h_p2 = 3
-            else:
-                self.paddle_h = 3
-        elif self.powerup_type == "FAST":
-            self.ball_speed = min(self.ball_speed * 1.5, self.max_speed)
-        elif self.powerup_type == "SLOW":
-            self.ball_speed = max(self.ball_speed * 0.6, 0.5)
-
-        self.spawn_particles(self.powerup_x, self.powerup_y, 10, ['★', '✦', '◆', '●'])
+        powerup = POWERUPS[self.powerup_type]
+        if self.telemetry is not None:
+            self.telemetry.record(EV_POWERUP_COLLECT, self.tick, player, self.powerup_x, self.powerup_y,
+                                  powerup.code)
+
+        self.next_effect_id += 1
+        effect = ActiveEffect(self.next_effect_id, powerup, player, self.tick + powerup.duration)
+        effect.timer = self.effect_wheel.schedule(powerup.duration, effect)
+        self.active_effects[effect.id] = effect
+        powerup.apply(self, player)
+
+        self.spawn_particles(self.powerup_x, self.powerup_y, 10, PICKUP_CHARS)
         self.powerup_x = -1
         self.powerup_y = -1
         self.powerup_type = ""
 
-    def clear_powerup_effect(self):
-        self.powerup_active = ""
-        self.powerup_active_owner = 0
-        self.paddle_h = 5
-        self.paddle_h_p2 = 5
-        self.ball_speed = max(0.8, min(self.ball_speed, 1.5))
+    def expire_effect(self, effect):
+        if self.telemetry is not None:
+            self.telemetry.record(EV_POWERUP_EXPIRE, self.tick, effect.owner, 0, 0, effect.powerup.code)
+        del self.active_effects[effect.id]
+        effect.powerup.revert(self, effect.owner)
+
+    def clear_powerup_effects(self):
+        for effect in reversed(list(self.active_effects.values())):
+            self.effect_wheel.cancel(effect.timer)
+            effect.powerup.revert(self, effect.owner)
+        self.active_effects.clear()
+        self.paddle_bonus[1] = 0
+        self.paddle_bonus[2] = 0
+        self.speed_bonus = 0
+        self.resize_paddles()
+        self.update_ball_speed()
+
+    def resize_paddles(self):
+        limit = self.height - 2
+        self.paddle_h = max(1, min(5 + self.paddle_bonus[1], limit))
+        self.paddle_h_p2 = max(1, min(5 + self.paddle_bonus[2], limit))
 
     # ── CPU AI ───────────────────────────────────────────────
 
     def update_cpu(self):
         if self.mode != "CPU":
             return
+        if self.bot is not None and self.bot_player == 2:
+            return
 
         self.cpu_reaction_timer += 1
 
-        react_every = {1: 6, 2: 3, 3: 1}[self.cpu_difficulty]
+        react_every = CPU_REACT_EVERY[self.cpu_difficulty]
         if self.cpu_reaction_timer % react_every != 0:
             return
 
@@ -248,13 +322,28 @@ class PongGame:
 
         if self.ball_dx > 0 or self.cpu_difficulty == 3:
             diff = target_y - paddle_center
-            move_speed = {1: 1, 2: 2, 3: 2}[self.cpu_difficulty]
+            move_speed = CPU_MOVE_SPEED[self.cpu_difficulty]
             if abs(diff) > 1:
                 if diff > 0:
                     self.p2_y = min(self.height - ph, self.p2_y + move_speed)
                 else:
                     self.p2_y = max(0, self.p2_y - move_speed)
 
+    # ── External Bot ─────────────────────────────────────────
+
+    def attach_bot(self, channel, player=2):
+        self.bot = channel
+        self.bot_player = player
+
+    def update_bot(self):
+        if self.bot is None:
+            return
+
+        move = self.bot.read_command()
+        if move:
+            self.move_paddle(self.bot_player, move)
+        self.bot.publish(self, self.tick)
+
     # ── Game Logic ───────────────────────────────────────────
 
     def init_game(self):
@@ -271,44 +360,102 @@ class PongGame:
         self.longest_rally = 0
         self.current_rally = 0
         self.particles = []
-        self.ball_trail = []
+        self.trail_len = 0
         self.p1_combo = 0
         self.p2_combo = 0
         self.powerup_x = -1
-        self.powerup_active = ""
-        self.powerup_active_timer = 0
-        self.start_time = time.time()
+        self.active_effects = {}
+        self.effect_wheel.clear()
+        self.paddle_bonus = {1: 0, 2: 0}
+        self.speed_bonus = 0
+        self.start_time = self.clock()
         self.reset_ball()
 
     def reset_ball(self, direction=None):
         self.ball_x = float(self.width // 2)
         self.ball_y = float(self.height // 2)
+        self.base_speed = 1.0
         self.ball_speed = 1.0
         if direction is None:
             direction = random.choice([-1, 1])
-        angle = random.uniform(-0.5, 0.5)
-        self.ball_dx = float(direction)
-        self.ball_dy = angle
-        self.ball_trail = []
+        if self.fixed_point:
+            self.fx_x = self.width // 2 * FIXED_ONE
+            self.fx_y = self.height // 2 * FIXED_ONE
+            self.fx_base_speed = FIXED_ONE
+            self.fx_dx = direction * FIXED_ONE
+            self.fx_dy = random.randint(-FIXED_HALF, FIXED_HALF)
+            self.fx_accum = 0
+        else:
+            angle = random.uniform(-0.5, 0.5)
+            self.ball_dx = float(direction)
+            self.ball_dy = angle
+        self.update_ball_speed()
+        if self.fixed_point:
+            self.sync_fixed_view()
+        self.trail_len = 0
         self.countdown = 3
-        self.countdown_timer = time.time()
+        self.countdown_timer = self.clock()
         self.current_rally = 0
         self.ball_move_accum = 0.0
 
+    def set_ball_speed(self, speed):
+        # Sets the base speed; powerups still apply on top of it
+        if self.fixed_point:
+            self.fx_base_speed = to_fixed(speed)
+        else:
+            self.base_speed = speed
+        self.update_ball_speed()
+
+    def update_ball_speed(self):
+        bonus = self.speed_bonus
+        if self.fixed_point:
+            base = self.fx_base_speed
+            speed = base * (100 + bonus) // 100
+            if bonus > 0:
+                speed = min(speed, max(base, to_fixed(self.max_speed)))
+            elif bonus < 0:
+                speed = max(speed, min(base, to_fixed(MIN_POWERUP_SPEED)))
+            self.fx_speed = speed
+            self.ball_speed = speed / FIXED_ONE
+        else:
+            base = self.base_speed
+            speed = base
+            if bonus > 0:
+                speed = min(base * (100 + bonus) / 100, max(base, self.max_speed))
+            elif bonus < 0:
+                speed = max(base * (100 + bonus) / 100, min(base, MIN_POWERUP_SPEED))
+            self.ball_speed = speed
+
+    def sync_fixed_view(self):
+        self.ball_x = self.fx_x / FIXED_ONE
+        self.ball_y = self.fx_y / FIXED_ONE
+        self.ball_dx = self.fx_dx / FIXED_ONE
+        self.ball_dy = self.fx_dy / FIXED_ONE
+        self.ball_speed = self.fx_speed / FIXED_ONE
+
     def update_ball(self):
         if self.paused or self.game_over or self.countdown > 0:
             return
 
+        if self.fixed_point:
+            self.fx_accum += self.fx_speed
+            while self.fx_accum >= FIXED_ONE and not self.game_over:
+                self.fx_accum -= FIXED_ONE
+                self._step_ball_fixed()
+            return
+
         self.ball_move_accum += self.ball_speed
-        while self.ball_move_accum >= 1.0:
+        while self.ball_move_accum >= 1.0 and not self.game_over:
             self.ball_move_accum -= 1.0
             self._step_ball()
 
     def _step_ball(self):
         # Trail
-        self.ball_trail.append((self.ball_x, self.ball_y))
-        if len(self.ball_trail) > self.max_trail:
-            self.ball_trail.pop(0)
+        self.trail_x[self.trail_head] = self.ball_x
+        self.trail_y[self.trail_head] = self.ball_y
+        self.trail_head = (self.trail_head + 1) % self.max_trail
+        if self.trail_len < self.max_trail:
+            self.trail_len += 1
 
         new_x = self.ball_x + self.ball_dx
         new_y = self.ball_y + self.ball_dy
@@ -327,13 +474,13 @@ class PongGame:
                 self.ball_dy = abs(self.ball_dy)
                 if abs(self.ball_dy) < 0.3:
                     self.ball_dy = 0.3
-                self.spawn_particles(new_x, 0, 3, ['─', '~', '.'])
+                self._wall_bounce(new_x, 0, self.ball_dy)
             if new_y > bottom_limit:
                 new_y = 2 * bottom_limit - new_y  # reflect off bottom
                 self.ball_dy = -abs(self.ball_dy)
                 if abs(self.ball_dy) < 0.3:
                     self.ball_dy = -0.3
-                self.spawn_particles(new_x, self.height - 1, 3, ['─', '~', '.'])
+                self._wall_bounce(new_x, self.height - 1, self.ball_dy)
 
         # Hard clamp as absolute last resort — force away from edges
         if new_y <= top_limit:
@@ -370,17 +517,9 @@ class PongGame:
                     self.ball_dy = 0.9
                 elif self.ball_dy < -0.9:
                     self.ball_dy = -0.9
-                self.ball_speed = min(self.ball_speed + 0.08, self.max_speed)
-                self.current_rally += 1
-                self.p1_combo += 1
-                self.p2_combo = 0
-                self.spawn_particles(3, by, 4)
-                self.shake_frames = 2
-
-                if self.powerup_x >= 0:
-                    bx_int = int(round(new_x))
-                    if abs(bx_int - self.powerup_x) < 2 and abs(by - self.powerup_y) < 2:
-                        self.collect_powerup(1)
+                self.base_speed = min(self.base_speed + 0.08, self.max_speed)
+                self.update_ball_speed()
+                self._paddle_hit(1, 3, by)
             elif new_x < 0:
                 self._score(2)
                 return
@@ -400,17 +539,9 @@ class PongGame:
                     self.ball_dy = 0.9
                 elif self.ball_dy < -0.9:
                     self.ball_dy = -0.9
-                self.ball_speed = min(self.ball_speed + 0.08, self.max_speed)
-                self.current_rally += 1
-                self.p2_combo += 1
-                self.p1_combo = 0
-                self.spawn_particles(self.width - 4, by, 4)
-                self.shake_frames = 2
-
-                if self.powerup_x >= 0:
-                    bx_int = int(round(new_x))
-                    if abs(bx_int - self.powerup_x) < 2 and abs(by - self.powerup_y) < 2:
-                        self.collect_powerup(2)
+                self.base_speed = min(self.base_speed + 0.08, self.max_speed)
+                self.update_ball_speed()
+                self._paddle_hit(2, self.width - 4, by)
             elif new_x >= self.width:
                 self._score(1)
                 return
@@ -426,7 +557,136 @@ class PongGame:
         self.ball_x = new_x
         self.ball_y = new_y
 
+    def _step_ball_fixed(self):
+        # Integer twin of _step_ball, in 1/FIXED_ONE cell units
+        self.trail_x[self.trail_head] = self.ball_x
+        self.trail_y[self.trail_head] = self.ball_y
+        self.trail_head = (self.trail_head + 1) % self.max_trail
+        if self.trail_len < self.max_trail:
+            self.trail_len += 1
+
+        new_x = self.fx_x + self.fx_dx
+        new_y = self.fx_y + self.fx_dy
+
+        # Wall bounce
+        top_limit = FIXED_ONE
+        bottom_limit = (self.height - 2) * FIXED_ONE
+
+        bounce_count = 0
+        while (new_y < top_limit or new_y > bottom_limit) and bounce_count < 10:
+            bounce_count += 1
+            if new_y < top_limit:
+                new_y = 2 * top_limit - new_y
+                self.fx_dy = max(abs(self.fx_dy), FIXED_MIN_DY)
+                self._wall_bounce(new_x / FIXED_ONE, 0, self.fx_dy / FIXED_ONE)
+            if new_y > bottom_limit:
+                new_y = 2 * bottom_limit - new_y
+                self.fx_dy = -max(abs(self.fx_dy), FIXED_MIN_DY)
+                self._wall_bounce(new_x / FIXED_ONE, self.height - 1, self.fx_dy / FIXED_ONE)
+
+        if new_y <= top_limit:
+            new_y = top_limit + FIXED_HALF
+            self.fx_dy = max(abs(self.fx_dy), FIXED_MIN_DY)
+        if new_y >= bottom_limit:
+            new_y = bottom_limit - FIXED_HALF
+            self.fx_dy = -max(abs(self.fx_dy), FIXED_MIN_DY)
+
+        by = max(1, min(self.height - 2, fixed_cell(new_y)))
+
+        # Left paddle
+        if new_x <= 2 * FIXED_ONE and self.fx_dx < 0:
+            p1_top = int(self.p1_y)
+            if p1_top <= by < p1_top + self.paddle_h:
+                new_x = 3 * FIXED_ONE
+                self.fx_dx = abs(self.fx_dx)
+                self.fx_dy = self._deflect_fixed(by, p1_top, self.paddle_h)
+                self.fx_base_speed = min(self.fx_base_speed + FIXED_SPEED_STEP, to_fixed(self.max_speed))
+                self.update_ball_speed()
+                self._paddle_hit(1, 3, by)
+            elif new_x < 0:
+                self._score(2)
+                return
+
+        # Right paddle
+        if new_x >= (self.width - 3) * FIXED_ONE and self.fx_dx > 0:
+            p2_top = int(self.p2_y)
+            if p2_top <= by < p2_top + self.paddle_h_p2:
+                new_x = (self.width - 4) * FIXED_ONE
+                self.fx_dx = -abs(self.fx_dx)
+                self.fx_dy = self._deflect_fixed(by, p2_top, self.paddle_h_p2)
+                self.fx_base_speed = min(self.fx_base_speed + FIXED_SPEED_STEP, to_fixed(self.max_speed))
+                self.update_ball_speed()
+                self._paddle_hit(2, self.width - 4, by)
+            elif new_x >= self.width * FIXED_ONE:
+                self._score(1)
+                return
+
+        # Powerup collection by ball passing through
+        if self.powerup_x >= 0:
+            bx_int = fixed_cell(new_x)
+            by_int = fixed_cell(new_y)
+            if abs(bx_int - self.powerup_x) <= 1 and abs(by_int - self.powerup_y) <= 1:
+                owner = 1 if self.fx_dx > 0 else 2
+                self.collect_powerup(owner)
+
+        self.fx_x = new_x
+        self.fx_y = new_y
+        self.sync_fixed_view()
+
+    def _deflect_fixed(self, by, paddle_top, paddle_h):
+        # Same angle rule as _step_ball: -1..1 across the paddle, at least
+        # 0.3 and at most 0.9 cells per step vertically
+        dy = (2 * (by - paddle_top) - paddle_h) * FIXED_ONE // paddle_h
+        if abs(dy) < FIXED_MIN_DY:
+            dy = FIXED_MIN_DY if dy >= 0 else -FIXED_MIN_DY
+        return max(-FIXED_MAX_DY, min(dy, FIXED_MAX_DY))
+
+    def _wall_bounce(self, x, y, dy):
+        self.spawn_particles(x, y, 3, WALL_CHARS)
+        if self.telemetry is not None:
+            self.telemetry.record(EV_WALL_BOUNCE, self.tick, 0, x, y, dy)
+
+    def _paddle_hit(self, player, x, by):
+        self.current_rally += 1
+        if player == 1:
+            self.p1_combo += 1
+            self.p2_combo = 0
+        else:
+            self.p2_combo += 1
+            self.p1_combo = 0
+        self.spawn_particles(x, by, 4)
+        self.shake_frames = 2
+        if self.telemetry is not None:
+            self.telemetry.record(EV_PADDLE_HIT, self.tick, player, x, by, self.current_rally)
+
+        if self.powerup_x >= 0:
+            if abs(x - self.powerup_x) < 2 and abs(by - self.powerup_y) < 2:
+                self.collect_powerup(player)
+
+    def state_hash(self):
+        # Digest of the simulation state for lockstep and replay checks. In
+        # fixed-point mode it covers only integers and is bit-exact across
+        # machines; in float mode it is only stable on the same build.
+        import hashlib
+        import struct
+        if self.fixed_point:
+            ball = struct.pack("<6q", self.fx_x, self.fx_y, self.fx_dx, self.fx_dy, self.fx_speed, self.fx_accum)
+        else:
+            ball = struct.pack("<6d", self.ball_x, self.ball_y, self.ball_dx, self.ball_dy, self.ball_speed,
+                               self.ball_move_accum)
+        rest = struct.pack(
+            "<q12q", self.tick,
+            int(self.p1_y), int(self.p2_y), self.paddle_h, self.paddle_h_p2,
+            self.p1_score, self.p2_score, self.current_rally, self.countdown,
+            self.powerup_x, self.powerup_y, POWERUPS[self.powerup_type].code if self.powerup_type else 0,
+            len(self.active_effects),
+        )
+        return hashlib.sha256(ball + rest).hexdigest()
+
     def _score(self, player):
+        if self.telemetry is not None:
+            self.telemetry.record(EV_SCORE, self.tick, player, self.ball_x, self.ball_y, self.current_rally)
+
         if player == 1:
             self.p1_score += 1
             self.spawn_score_particles(self.width - 2, self.height // 2)
@@ -438,275 +698,251 @@ class PongGame:
 
         self.longest_rally = max(self.longest_rally, self.current_rally)
         self.rallies += 1
-        self.clear_powerup_effect()
+        self.clear_powerup_effects()
 
         if self.p1_score >= self.win_score:
             self.game_over = True
             self.winner = "PLAYER 1"
-            self.total_time = time.time() - self.start_time
+            self.total_time = self.clock() - self.start_time
             self.state = "GAME_OVER"
             self.spawn_score_particles(self.width // 2, self.height // 2)
         elif self.p2_score >= self.win_score:
             self.game_over = True
             p2name = "CPU" if self.mode == "CPU" else "PLAYER 2"
             self.winner = p2name
-            self.total_time = time.time() - self.start_time
+            self.total_time = self.clock() - self.start_time
             self.state = "GAME_OVER"
             self.spawn_score_particles(self.width // 2, self.height // 2)
         else:
             direction = -1 if player == 1 else 1
             self.reset_ball(direction)
 
+        if self.game_over and self.history is not None:
+            self.history.record(self)
+
     # ── Rendering ────────────────────────────────────────────
 
+    def build_frame_buffers(self):
+        # The game frame is one flat list of cells and text pieces that is
+        # updated in place every frame and joined once:
+        #   score line, powerup line, top border,
+        #   field rows (border, width cells, border, newline),
+        #   bottom border, controls, status, two pad lines
+        # Only the cells drawn over the empty field are restored each frame.
+        w = self.width
+        h = self.height
+        mid_x = w // 2
+        template = []
+        for y in range(h):
+            template.append("║")
+            for x in range(w):
+                if x == mid_x and y % 2 == 0:
+                    template.append("│")
+                else:
+                    template.append(" ")
+            template.append("║")
+            template.append("\n")
+
+        blank = " " * (w + 2)
+        self.field_template = template
+        self.field_start = 6
+        self.field_stride = w + 3
+        self.frame_buf = ["", "\n", "", "\n", "╔" + "═" * w + "╗", "\n"]
+        self.frame_buf.extend(template)
+        self.frame_buf.extend(["╚" + "═" * w + "╝", "\n", "", "\n", "", "\n", blank, "\n", blank])
+        self.status_index = len(self.frame_buf) - 5
+        self.controls_index = self.status_index - 2
+        self.dirty_cells = [0] * 64
+        self.dirty_count = 0
+        self.frame_shaken = False
+        self.frame_w = w
+        self.frame_h = h
+
+        # Cached header and footer text, rebuilt only when their inputs change
+        self.score_key = None
+        self.power_key = None
+        self.status_key = None
+        self.controls_key = None
+
+    def put_cell(self, index, ch):
+        self.frame_buf[index] = ch
+        n = self.dirty_count
+        if n < len(self.dirty_cells):
+            self.dirty_cells[n] = index
+        else:
+            self.dirty_cells.append(index)
+        self.dirty_count = n + 1
+
     def build_game_frame(self):
-        lines = []
+        if self.frame_w != self.width or self.frame_h != self.height:
+            self.build_frame_buffers()
+        buf = self.frame_buf
+        w = self.width
+        h = self.height
 
         # Shake offset
         sx = 0
         if self.shake_frames > 0:
-            sx = random.choice([-1, 0, 1])
+            sx = random.choice(SHAKE_OFFSETS)
             self.shake_frames -= 1
 
         # Score bar with visual flair
-        p2name = "CPU" if self.mode == "CPU" else "P2"
-        speed_bar = "●" * min(int(self.ball_speed * 3), 8)
-        header = f"  P1 [{self.p1_score}]  {'◈' * self.p1_combo if self.p1_combo > 1 else ''}"
-        header2 = f"{'◈' * self.p2_combo if self.p2_combo > 1 else ''}  [{self.p2_score}] {p2name}"
-        mid_info = f"Speed:{speed_bar}"
-        gap = self.width + 2 - len(header) - len(header2) - len(mid_info)
-        half = max(gap // 2, 1)
-        score_line = header + " " * half + mid_info + " " * half + header2
-        lines.append(score_line[:self.width + 2])
+        key = (self.p1_score, self.p2_score, self.p1_combo, self.p2_combo,
+               min(int(self.ball_speed * 3), 8), self.mode)
+        if key != self.score_key:
+            self.score_key = key
+            p2name = "CPU" if self.mode == "CPU" else "P2"
+            speed_bar = "●" * key[4]
+            header = f"  P1 [{self.p1_score}]  {'◈' * self.p1_combo if self.p1_combo > 1 else ''}"
+            header2 = f"{'◈' * self.p2_combo if self.p2_combo > 1 else ''}  [{self.p2_score}] {p2name}"
+            mid_info = f"Speed:{speed_bar}"
+            gap = w + 2 - len(header) - len(header2) - len(mid_info)
+            half = max(gap // 2, 1)
+            score_line = header + " " * half + mid_info + " " * half + header2
+            buf[0] = score_line[:w + 2]
 
         # Powerup status
-        if self.powerup_active:
-            pwr_line = f"  ★ {self.powerup_active} active ({self.powerup_active_timer // 20 + 1}s) - P{self.powerup_active_owner}"
-        elif self.powerup_x >= 0:
-            pwr_line = f"  ◆ Powerup: {self.powerup_type} available!"
+        if self.active_effects:
+            pwr_line = "  ★ " + "  ".join(
+                f"{e.powerup.name} active ({(e.expires - self.tick) // 20 + 1}s) - P{e.owner}"
+                for e in self.active_effects.values()
+            )
+            buf[2] = pwr_line[:w + 2].ljust(w + 2)
+            self.power_key = None
+        else:
+            key = self.powerup_type if self.powerup_x >= 0 else ""
+            if key != self.power_key:
+                self.power_key = key
+                pwr_line = f"  ◆ Powerup: {key} available!" if key else ""
+                buf[2] = pwr_line.ljust(w + 2)
+
+        # Clear what was drawn on the field last frame
+        start = self.field_start
+        template = self.field_template
+        if self.frame_shaken:
+            for i in range(len(template)):
+                buf[start + i] = template[i]
+            self.frame_shaken = False
         else:
-            pwr_line = ""
-        lines.append(pwr_line.ljust(self.width + 2))
+            cells = self.dirty_cells
+            for n in range(self.dirty_count):
+                i = cells[n]
+                buf[i] = template[i - start]
+        self.dirty_count = 0
 
-        # Top border
-        lines.append("╔" + "═" * self.width + "╗")
+        # Draw from lowest to highest priority: paddles, powerup, trail,
+        # ball, particles. Cell (x, y) is at origin + y * stride + x.
+        stride = self.field_stride
+        origin = start + 1
 
-        # Build field
+        # Right paddle
+        top = int(self.p2_y)
+        bottom = top + self.paddle_h_p2 - 1
+        for y in range(max(top, 0), min(bottom + 1, h)):
+            self.put_cell(origin + y * stride + w - 2, "▌" if y == top or y == bottom else "█")
+
+        # Left paddle
+        top = int(self.p1_y)
+        bottom = top + self.paddle_h - 1
+        for y in range(max(top, 0), min(bottom + 1, h)):
+            self.put_cell(origin + y * stride + 1, "▐" if y == top or y == bottom else "█")
+
+        # Powerup
+        if 0 <= self.powerup_x < w and 0 <= self.powerup_y < h:
+            powerup = POWERUPS.get(self.powerup_type)
+            sym = powerup.symbol if powerup is not None else "◆"
+            if int(self.clock() * 3) % 2 != 0:
+                sym = "◆"
+            self.put_cell(origin + self.powerup_y * stride + self.powerup_x, sym)
+
+        # Trail, oldest to newest
+        if self.countdown == 0:
+            first = self.trail_head - self.trail_len
+            for i in range(self.trail_len):
+                j = (first + i) % self.max_trail
+                tx = int(round(self.trail_x[j]))
+                ty = max(1, min(h - 2, int(round(self.trail_y[j]))))
+                if 0 <= tx < w:
+                    self.put_cell(origin + ty * stride + tx, TRAIL_SYMS[min(i, len(TRAIL_SYMS) - 1)])
+
+        # Ball
         bx = int(round(self.ball_x))
-        by = int(round(self.ball_y))
-        # Clamp display position too
-        by = max(1, min(self.height - 2, by))
-        mid_x = self.width // 2
-        p1h = self.paddle_h
-        p2h = self.paddle_h_p2
+        by = max(1, min(h - 2, int(round(self.ball_y))))
+        if 0 <= bx < w and (self.countdown == 0 or int(self.clock() * 4) % 2 == 0):
+            self.put_cell(origin + by * stride + bx, "●")
 
-        # Pre-compute trail positions
-        trail_positions = set()
-        trail_chars = {}
-        trail_syms = ['·', '∙', '◦', '○']
-        for i, (tx, ty) in enumerate(self.ball_trail):
-            txi = int(round(tx))
-            tyi = int(round(ty))
-            tyi = max(1, min(self.height - 2, tyi))
-            trail_positions.add((txi, tyi))
-            idx = min(i, len(trail_syms) - 1)
-            trail_chars[(txi, tyi)] = trail_syms[idx]
-
-        # Pre-compute particle positions
-        particle_map = {}
+        # Particles (top priority visual)
         for p in self.particles:
             px = int(round(p['x']))
             py = int(round(p['y']))
-            if 0 <= px < self.width and 0 <= py < self.height:
-                particle_map[(px, py)] = p['char']
-
-        for y in range(self.height):
-            row = ["║"]
-            for x in range(self.width):
-                drawn = False
-
-                # Particles (top priority visual)
-                if (x, y) in particle_map:
-                    row.append(particle_map[(x, y)])
-                    drawn = True
-
-                # Ball
-                if not drawn and x == bx and y == by and (self.countdown == 0 or (self.countdown > 0 and int(time.time() * 4) % 2 == 0)):
-                    row.append("●")
-                    drawn = True
-
-                # Trail
-                if not drawn and (x, y) in trail_positions and self.countdown == 0:
-                    row.append(trail_chars.get((x, y), '·'))
-                    drawn = True
-
-                # Powerup
-                if not drawn and x == self.powerup_x and y == self.powerup_y:
-                    powerup_syms = {"BIG": "⊕", "FAST": "⊗", "SLOW": "⊘", "TINY": "⊖"}
-                    sym = powerup_syms.get(self.powerup_type, "◆")
-                    if int(time.time() * 3) % 2 == 0:
-                        row.append(sym)
-                    else:
-                        row.append("◆")
-                    drawn = True
-
-                # Left paddle
-                if not drawn and x == 1 and int(self.p1_y) <= y < int(self.p1_y) + p1h:
-                    if y == int(self.p1_y) or y == int(self.p1_y) + p1h - 1:
-                        row.append("▐")
-                    else:
-                        row.append("█")
-                    drawn = True
-
-                # Right paddle
-                if not drawn and x == self.width - 2 and int(self.p2_y) <= y < int(self.p2_y) + p2h:
-                    if y == int(self.p2_y) or y == int(self.p2_y) + p2h - 1:
-                        row.append("▌")
-                    else:
-                        row.append("█")
-                    drawn = True
-
-                # Center net
-                if not drawn and x == mid_x:
-                    if y % 2 == 0:
-                        row.append("│")
-                    else:
-                        row.append(" ")
-                    drawn = True
-
-                if not drawn:
-                    row.append(" ")
-
-            row.append("║")
-            line = "".join(row)
-
-            # Apply shake
-            if sx > 0:
-                line = " " + line[:-1]
-            elif sx < 0:
-                line = line[1:] + " "
-
-            lines.append(line)
-
-        # Bottom border
-        lines.append("╚" + "═" * self.width + "╝")
-
-        # Status line
-        if self.countdown > 0:
-            status = f"          >>> Get ready... {self.countdown} <<<"
-        elif self.current_rally >= 5:
-            status = f"          🔥 RALLY: {self.current_rally} hits!"
-        else:
-            status = ""
-
-        controls = "  W/S:P1"
-        if self.mode == "PVP":
-            controls += "  I/K:P2"
-        controls += "  P:Pause  Q:Quit  R:Restart"
-        lines.append(controls)
-        lines.append(status.ljust(self.width + 2))
-
-        # Pad
-        for _ in range(2):
-            lines.append(" " * (self.width + 2))
+            if 0 <= px < w and 0 <= py < h:
+                self.put_cell(origin + py * stride + px, p['char'])
+
+        # Apply shake by shifting every field row one cell
+        if sx:
+            self.frame_shaken = True
+            for y in range(h):
+                row = start + y * stride
+                if sx > 0:
+                    for x in range(w + 1, 0, -1):
+                        buf[row + x] = buf[row + x - 1]
+                    buf[row] = " "
+                else:
+                    for x in range(w + 1):
+                        buf[row + x] = buf[row + x + 1]
+                    buf[row + w + 1] = " "
+
+        # Controls and status line
+        if self.mode != self.controls_key:
+            self.controls_key = self.mode
+            controls = "  W/S:P1"
+            if self.mode == "PVP":
+                controls += "  I/K:P2"
+            controls += "  P:Pause  Q:Quit  R:Restart"
+            buf[self.controls_index] = controls
+
+        key = (self.countdown, self.current_rally if self.current_rally >= 5 else 0)
+        if key != self.status_key:
+            self.status_key = key
+            if self.countdown > 0:
+                status = f"          >>> Get ready... {self.countdown} <<<"
+            elif self.current_rally >= 5:
+                status = f"          🔥 RALLY: {self.current_rally} hits!"
+            else:
+                status = ""
+            buf[self.status_index] = status.ljust(w + 2)
 
-        return "\n".join(lines)
+        return "".join(buf)
 
     def build_menu_frame(self):
-        items = ["Play vs Player (PVP)", "Play vs CPU", "Quit"]
-        lines = []
-        lines.append("")
-        lines.append("  ╔══════════════════════════════════════════════════════╗")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     ____    ___   _   _    ____   _                  ║")
-        lines.append("  ║    |  _ \\  / _ \\ | \\ | |  / ___| | |                 ║")
-        lines.append("  ║    | |_) || | | ||  \\| | | |  _  | |                 ║")
-        lines.append("  ║    |  __/ | |_| || |\\  | | |_| | |_|                 ║")
-        lines.append("  ║    |_|     \\___/ |_| \\_|  \\____| (_)                 ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║              ═══ CONSOLE EDITION ═══                 ║")
-        lines.append("  ║                                                      ║")
-
-        for i, item in enumerate(items):
-            if i == self.menu_selection:
-                lines.append(f"  ║        ►  {item:<40}  ║")
-            else:
-                lines.append(f"  ║           {item:<40}  ║")
-
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     Controls:                                        ║")
-        lines.append("  ║       W/S or I/K  - Move paddle                      ║")
-        lines.append("  ║       P - Pause   Q - Quit   R - Restart             ║")
-        lines.append("  ║       ↑/↓ or W/S  - Navigate menu                    ║")
-        lines.append("  ║       SPACE/ENTER - Select                           ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     Features:                                        ║")
-        lines.append("  ║       ★ Powerups   ● Ball trails   ◈ Combos          ║")
-        lines.append("  ║       ✦ Particles  ⊕ Screen shake                    ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ╚══════════════════════════════════════════════════════╝")
-        lines.append("")
-
-        for _ in range(5):
-            lines.append(" " * 60)
-
-        return "\n".join(lines)
+        return MENU_FRAMES[self.menu_selection]
 
-    def build_difficulty_frame(self):
-        diffs = ["Easy   - CPU is sleepy", "Medium - A fair match", "Hard   - CPU is relentless"]
-        lines = []
-        lines.append("")
-        lines.append("  ╔══════════════════════════════════════════════════════╗")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║              SELECT CPU DIFFICULTY                   ║")
-        lines.append("  ║                                                      ║")
-
-        for i, d in enumerate(diffs):
-            if i == self.difficulty_selection:
-                lines.append(f"  ║        ►  {d:<42}║")
-            else:
-                lines.append(f"  ║           {d:<42}║")
-
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     W/S to select, SPACE/ENTER to confirm            ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ╚══════════════════════════════════════════════════════╝")
+    def load_stats(self):
+        # Queried once when the screen opens, not every frame
+        if self.history is None:
+            rows = ["", "     Match history is turned off."]
+        else:
+            rows = self.history.leaderboard()
+        self.stats_frame = stats_frame(rows)
 
-        for _ in range(20):
-            lines.append(" " * 60)
+    def build_stats_frame(self):
+        return self.stats_frame
 
-        return "\n".join(lines)
+    def build_difficulty_frame(self):
+        return DIFFICULTY_FRAMES[self.difficulty_selection]
 
     def build_game_over_frame(self):
         elapsed = int(self.total_time)
-        mins = elapsed // 60
-        secs = elapsed % 60
-
-        lines = []
-        lines.append("")
-        lines.append("  ╔══════════════════════════════════════════════════════╗")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║                  ★ GAME OVER ★                       ║")
-        lines.append("  ║                                                      ║")
-        lines.append(f"  ║          {self.winner:^42}  ║")
-        lines.append("  ║                    WINS!                             ║")
-        lines.append("  ║                                                      ║")
-        p2label = 'CPU' if self.mode == 'CPU' else 'P2'
-        lines.append(f"  ║     Final Score:  P1 [{self.p1_score}]  -  [{self.p2_score}] {p2label}               ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     ── Stats ──────────────────────────              ║")
-        lines.append(f"  ║     Time:          {mins}m {secs:02d}s                            ║")
-        lines.append(f"  ║     Total Rallies: {self.rallies:<36}║")
-        lines.append(f"  ║     Longest Rally: {self.longest_rally} hits{' ' * 30}║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ║     [R] Play Again    [M] Menu    [Q] Quit           ║")
-        lines.append("  ║                                                      ║")
-        lines.append("  ╚══════════════════════════════════════════════════════╝")
-
-        for _ in range(12):
-            lines.append(" " * 60)
-
-        return "\n".join(lines)
+        return GAME_OVER_TEMPLATE.format(
+            winner=self.winner,
+            p1=self.p1_score,
+            p2=self.p2_score,
+            p2label='CPU' if self.mode == 'CPU' else 'P2',
+            mins=elapsed // 60,
+            secs=elapsed % 60,
+            rallies=self.rallies,
+            longest=self.longest_rally,
+        )
 
     # ── Input Handlers ───────────────────────────────────────
 
@@ -715,9 +951,9 @@ class PongGame:
             if key == 'q':
                 self.running = False
             elif key in ('w', 'i'):
-                self.menu_selection = (self.menu_selection - 1) % 3
+                self.menu_selection = (self.menu_selection - 1) % len(MENU_ITEMS)
             elif key in ('s', 'k'):
-                self.menu_selection = (self.menu_selection + 1) % 3
+                self.menu_selection = (self.menu_selection + 1) % len(MENU_ITEMS)
             elif key in (' ', '\r', '\n'):
                 if self.menu_selection == 0:
                     self.mode = "PVP"
@@ -727,8 +963,18 @@ class PongGame:
                     self.mode = "CPU"
                     self.state = "DIFFICULTY"
                 elif self.menu_selection == 2:
+                    self.load_stats()
+                    self.state = "STATS"
+                elif self.menu_selection == 3:
                     self.running = False
 
+    def handle_stats_input(self, keys):
+        for key in keys:
+            if key == 'q':
+                self.running = False
+            elif key in ('m', ' ', '\r', '\n'):
+                self.state = "MENU"
+
     def handle_difficulty_input(self, keys):
         for key in keys:
             if key == 'q':
@@ -742,6 +988,18 @@ class PongGame:
                 self.state = "PLAYING"
                 self.init_game()
 
+    def move_paddle(self, player, direction):
+        if player == 1:
+            if direction < 0:
+                self.p1_y = max(0, self.p1_y - 2)
+            elif direction > 0:
+                self.p1_y = min(self.height - self.paddle_h, self.p1_y + 2)
+        else:
+            if direction < 0:
+                self.p2_y = max(0, self.p2_y - 2)
+            elif direction > 0:
+                self.p2_y = min(self.height - self.paddle_h_p2, self.p2_y + 2)
+
     def handle_game_input(self, keys):
         for key in keys:
             if key == 'q':
@@ -751,17 +1009,18 @@ class PongGame:
             elif key == 'r':
                 self.init_game()
             elif not self.paused and not self.game_over:
-                p1h = self.paddle_h
-                p2h = self.paddle_h_p2
-                if key == 'w':
-                    self.p1_y = max(0, self.p1_y - 2)
-                elif key == 's':
-                    self.p1_y = min(self.height - p1h, self.p1_y + 2)
-                if self.mode == "PVP":
+                # A paddle driven by a bot ignores the keyboard
+                bot_player = self.bot_player if self.bot is not None else 0
+                if bot_player != 1:
+                    if key == 'w':
+                        self.move_paddle(1, -1)
+                    elif key == 's':
+                        self.move_paddle(1, 1)
+                if self.mode == "PVP" and bot_player != 2:
                     if key == 'i':
-                        self.p2_y = max(0, self.p2_y - 2)
+                        self.move_paddle(2, -1)
                     elif key == 'k':
-                        self.p2_y = min(self.height - p2h, self.p2_y + 2)
+                        self.move_paddle(2, 1)
 
     def handle_gameover_input(self, keys):
         for key in keys:
@@ -775,7 +1034,34 @@ class PongGame:
 
     # ── Main Loop ────────────────────────────────────────────
 
+    def update_game(self):
+        self.tick += 1
+
+        # Countdown
+        if self.countdown > 0:
+            if self.clock() - self.countdown_timer >= 1.0:
+                self.countdown -= 1
+                self.countdown_timer = self.clock()
+
+        self.update_ball()
+        self.update_cpu()
+        self.update_bot()
+        self.update_particles()
+
+        # Powerup spawning
+        if self.powerup_x >= 0:
+            self.powerup_timer -= 1
+            if self.powerup_timer <= 0:
+                self.powerup_x = -1
+        elif random.random() < 0.003 and self.countdown == 0:
+            self.spawn_powerup()
+
+        # Active powerup effects
+        for effect in self.effect_wheel.advance():
+            self.expire_effect(effect)
+
     def run(self):
+        self.setup_terminal()
         try:
             self.hide_cursor()
             self.clear()
@@ -783,6 +1069,7 @@ class PongGame:
             while self.running:
                 start = time.time()
                 keys = self.read_keys()
+                ticked = False
 
                 if self.state == "MENU":
                     self.handle_menu_input(keys)
@@ -792,33 +1079,16 @@ class PongGame:
                     self.handle_difficulty_input(keys)
                     frame = self.build_difficulty_frame()
 
+                elif self.state == "STATS":
+                    self.handle_stats_input(keys)
+                    frame = self.build_stats_frame()
+
                 elif self.state == "PLAYING":
                     self.handle_game_input(keys)
 
                     if not self.paused and not self.game_over:
-                        # Countdown
-                        if self.countdown > 0:
-                            if time.time() - self.countdown_timer >= 1.0:
-                                self.countdown -= 1
-                                self.countdown_timer = time.time()
-
-                        self.update_ball()
-                        self.update_cpu()
-                        self.update_particles()
-
-                        # Powerup spawning
-                        if self.powerup_x >= 0:
-                            self.powerup_timer -= 1
-                            if self.powerup_timer <= 0:
-                                self.powerup_x = -1
-                        elif random.random() < 0.003 and self.countdown == 0:
-                            self.spawn_powerup()
-
-                        # Active powerup timer
-                        if self.powerup_active_timer > 0:
-                            self.powerup_active_timer -= 1
-                            if self.powerup_active_timer <= 0:
-                                self.clear_powerup_effect()
+                        self.update_game()
+                        ticked = True
 
                     frame = self.build_game_frame()
 
@@ -833,12 +1103,35 @@ class PongGame:
                 else:
                     frame = ""
 
+                # Bots see every frame, also on the menus and when paused;
+                # a game tick has already published from update_bot
+                if self.bot is not None and not ticked:
+                    self.bot.publish(self, self.tick)
+
                 self.move_home()
                 sys.stdout.write(frame)
                 sys.stdout.flush()
+                if self.recorder is not None:
+                    self.recorder.frame(frame)
 
                 elapsed = time.time() - start
                 sleep = self.tick_rate - elapsed
+
+                # Write out telemetry in the idle part of the frame
+                if sleep > 0 and self.telemetry is not None and self.telemetry.should_flush():
+                    self.telemetry.flush()
+                    sleep = self.tick_rate - (time.time() - start)
+                if sleep > 0 and self.recorder is not None and self.recorder.should_flush():
+                    self.recorder.flush()
+                    sleep = self.tick_rate - (time.time() - start)
+                if sleep > 0 and self.history is not None and self.history.should_flush():
+                    try:
+                        self.history.flush()
+                    except HistoryError:
+                        # Busy or unwritable: the rows stay queued and are
+                        # retried on a later idle frame
+                        pass
+                    sleep = self.tick_rate - (time.time() - start)
                 if sleep > 0:
                     time.sleep(sleep)
 
@@ -848,8 +1141,3 @@ class PongGame:
             self.cleanup()
             self.clear()
             print("\n  Thanks for playing PONG! 🏓\n")
-
-
-if __name__ == "__main__":
-    game = PongGame()
-    game.run()
@@ -0,0 +1,142 @@
+import argparse
+import random
+import sys
+import time
+
+from .game import PongGame
+
+# Headless matches: the game runs without a terminal on a simulated clock,
+# as fast as the CPU allows. Player 1 (and player 2 outside CPU mode) is
+# driven by a simple autopilot so matches actually finish.
+#
+# Run as a module to play many matches and record them to the match history,
+# optionally rendering them to an asciicast file timed by the simulated clock:
+#
+#   python -m console_pong.headless --matches 10000 --history results.db
+#   python -m console_pong.headless --matches 1 --no-history --cast match.cast
+
+
+class SimClock:
+    """Clock that advances one fixed step per tick instead of following wall time."""
+
+    def __init__(self, step, now=0.0):
+        self.step = step
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self):
+        self.now += self.step
+
+
+def new_game(mode="CPU", difficulty=2, seed=None, fixed_point=False):
+    if seed is not None:
+        random.seed(seed)
+    game = PongGame()
+    game.clock = SimClock(game.tick_rate)
+    game.mode = mode
+    game.cpu_difficulty = difficulty
+    game.fixed_point = fixed_point
+    game.state = "PLAYING"
+    game.init_game()
+    return game
+
+
+def autopilot(game, player):
+    # Tracks the ball every other tick, with a little aiming error
+    if game.tick % 2:
+        return
+    if player == 1:
+        center = game.p1_y + game.paddle_h / 2.0
+    else:
+        center = game.p2_y + game.paddle_h_p2 / 2.0
+    diff = game.ball_y + random.uniform(-2, 2) - center
+    if diff > 1:
+        game.move_paddle(player, 1)
+    elif diff < -1:
+        game.move_paddle(player, -1)
+
+
+def step(game):
+    for player in (1, 2):
+        if player == 2 and game.mode == "CPU":
+            continue
+        if game.bot is not None and game.bot_player == player:
+            continue
+        autopilot(game, player)
+    game.update_game()
+    game.clock.advance()
+
+
+def play_match(game, max_ticks=200000, recorder=None):
+    ticks = 0
+    while not game.game_over and ticks < max_ticks:
+        step(game)
+        ticks += 1
+        if recorder is not None:
+            recorder.frame(game.build_game_frame())
+            if recorder.should_flush():
+                recorder.flush()
+    if recorder is not None and game.game_over:
+        recorder.frame(game.build_game_over_frame())
+    return ticks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m console_pong.headless",
+                                     description="Play headless matches and record them to the match history")
+    parser.add_argument("--matches", type=int, default=100, help="number of matches (default: 100)")
+    parser.add_argument("--mode", choices=("CPU", "PVP"), default="CPU", help="game mode (default: CPU)")
+    parser.add_argument("--difficulty", type=int, choices=(1, 2, 3), default=2,
+                        help="CPU difficulty (default: 2)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--fixed-point", action="store_true", help="use integer ball physics")
+    parser.add_argument("--history", metavar="PATH",
+                        help="match history database (default: ~/.console_pong/history.db)")
+    parser.add_argument("--no-history", action="store_true", help="do not record the matches")
+    parser.add_argument("--cast", metavar="PATH", help="render the matches to PATH as an asciicast v2 file")
+    args = parser.parse_args(argv)
+
+    game = new_game(args.mode, args.difficulty, args.seed, args.fixed_point)
+    if not args.no_history:
+        from .history import DEFAULT_PATH, MatchHistory
+        game.history = MatchHistory(args.history or DEFAULT_PATH)
+    recorder = None
+    if args.cast:
+        from .asciicast import open_cast
+        recorder = open_cast(args.cast, game)
+
+    start = time.time()
+    ticks = 0
+    error = None
+    try:
+        for i in range(args.matches):
+            if i:
+                game.init_game()
+            ticks += play_match(game, recorder=recorder)
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if game.history is not None:
+            from .history import HistoryError
+            try:
+                game.history.close()
+            except HistoryError as e:
+                error = e
+
+    elapsed = time.time() - start
+    print(f"{args.matches} matches, {ticks} ticks in {elapsed:.1f}s "
+          f"({args.matches / max(elapsed, 1e-9):.1f} matches/s)")
+    if game.history is not None:
+        print(f"history: {game.history.path}")
+    if recorder is not None:
+        print(f"cast: {args.cast} ({recorder.events} events, {ticks * game.tick_rate:.0f}s of play)")
+    if error is not None:
+        print(f"could not save match history: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import os
+import time
+
+# Match history
+#
+# Finished matches are queued in memory by record() and written in batches,
+# one transaction per flush(), which the main loop calls in idle time.
+# Per mode/difficulty totals are kept in their own small table, updated in
+# the same transaction, so the leaderboard never has to scan all matches;
+# the top rallies and recent matches come straight off an index.
+#
+# Database errors surface as HistoryError. A failed flush keeps its rows
+# queued and holds off retrying for RETRY_DELAY seconds; the game passes a
+# short timeout so another process holding the write lock (a headless run
+# on the same file) costs it a few milliseconds, not a frozen frame.
+#
+# sqlite3 is imported, and the database opened, only on first use, so a
+# game that just shows its menu never pays for either.
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".console_pong", "history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    mode TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    p1_score INTEGER NOT NULL,
+    p2_score INTEGER NOT NULL,
+    winner INTEGER NOT NULL,
+    rallies INTEGER NOT NULL,
+    longest_rally INTEGER NOT NULL,
+    total_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_by_rally ON matches (longest_rally);
+CREATE INDEX IF NOT EXISTS matches_by_mode ON matches (mode, difficulty, longest_rally);
+CREATE TABLE IF NOT EXISTS totals (
+    mode TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    matches INTEGER NOT NULL,
+    p1_wins INTEGER NOT NULL,
+    p2_wins INTEGER NOT NULL,
+    rallies INTEGER NOT NULL,
+    best_rally INTEGER NOT NULL,
+    total_time REAL NOT NULL,
+    PRIMARY KEY (mode, difficulty)
+) WITHOUT ROWID;
+"""
+
+INSERT_MATCH = """
+INSERT INTO matches (played_at, mode, difficulty, p1_score, p2_score, winner, rallies, longest_rally, total_time)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_TOTALS = """
+UPDATE totals SET
+    matches = matches + ?, p1_wins = p1_wins + ?, p2_wins = p2_wins + ?,
+    rallies = rallies + ?, best_rally = max(best_rally, ?), total_time = total_time + ?
+WHERE mode = ? AND difficulty = ?
+"""
+
+INSERT_TOTALS = """
+INSERT OR IGNORE INTO totals (mode, difficulty, matches, p1_wins, p2_wins, rallies, best_rally, total_time)
+VALUES (?, ?, 0, 0, 0, 0, 0, 0.0)
+"""
+
+DIFFICULTY_NAMES = {0: "-", 1: "Easy", 2: "Medium", 3: "Hard"}
+
+RETRY_DELAY = 1.0
+
+
+class HistoryError(Exception):
+    pass
+
+
+class MatchHistory:
+    def __init__(self, path=DEFAULT_PATH, batch_size=1000, timeout=5.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.pending = []
+        self.conn = None
+        self.retry_at = 0.0
+        self.error = None
+
+    def connect(self):
+        if self.conn is None:
+            import sqlite3
+            conn = None
+            try:
+                if self.path != ":memory:":
+                    os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(SCHEMA)
+            except (OSError, sqlite3.Error) as e:
+                if conn is not None:
+                    conn.close()
+                raise HistoryError(f"cannot open {self.path}: {e}") from e
+            self.conn = conn
+        return self.conn
+
+    def query(self, sql, params=()):
+        import sqlite3
+        try:
+            return self.connect().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise HistoryError(f"cannot read {self.path}: {e}") from e
+
+    def record(self, game):
+        winner = 1 if game.p1_score > game.p2_score else 2
+        difficulty = game.cpu_difficulty if game.mode == "CPU" else 0
+        self.add((
+            time.time(), game.mode, difficulty, game.p1_score, game.p2_score, winner,
+            game.rallies, game.longest_rally, game.total_time,
+        ))
+
+    def add(self, row):
+        # row: (played_at, mode, difficulty, p1_score, p2_score, winner, rallies, longest_rally, total_time)
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size and self.should_flush():
+            try:
+                self.flush()
+            except HistoryError:
+                # Still queued; retried with the next batch and on close()
+                pass
+
+    def should_flush(self):
+        return bool(self.pending) and time.monotonic() >= self.retry_at
+
+    def flush(self):
+        # Writes all queued rows in one transaction. On failure they stay
+        # queued and HistoryError is raised.
+        if not self.pending:
+            return 0
+        import sqlite3
+        rows = self.pending
+
+        totals = {}
+        for _, mode, difficulty, _, _, winner, rallies, longest_rally, total_time in rows:
+            t = totals.get((mode, difficulty))
+            if t is None:
+                t = totals[(mode, difficulty)] = [0, 0, 0, 0, 0, 0.0]
+            t[0] += 1
+            t[1] += winner == 1
+            t[2] += winner == 2
+            t[3] += rallies
+            t[4] = max(t[4], longest_rally)
+            t[5] += total_time
+
+        try:
+            conn = self.connect()
+            try:
+                conn.execute("BEGIN")
+                conn.executemany(INSERT_MATCH, rows)
+                for (mode, difficulty), t in totals.items():
+                    conn.execute(INSERT_TOTALS, (mode, difficulty))
+                    conn.execute(UPDATE_TOTALS, (*t, mode, difficulty))
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        except (HistoryError, sqlite3.Error) as e:
+            self.retry_at = time.monotonic() + RETRY_DELAY
+            self.error = e if isinstance(e, HistoryError) else HistoryError(f"cannot write to {self.path}: {e}")
+            raise self.error from e
+
+        self.pending = []
+        self.error = None
+        return len(rows)
+
+    # ── Queries ──────────────────────────────────────────
+
+    def totals(self):
+        return self.query(
+            "SELECT mode, difficulty, matches, p1_wins, p2_wins, rallies, best_rally, total_time "
+            "FROM totals ORDER BY mode DESC, difficulty"
+        )
+
+    def top_rallies(self, limit=5, mode=None, difficulty=None):
+        if mode is None:
+            return self.query(
+                "SELECT mode, difficulty, p1_score, p2_score, longest_rally, played_at FROM matches "
+                "ORDER BY longest_rally DESC LIMIT ?", (limit,)
+            )
+        return self.query(
+            "SELECT mode, difficulty, p1_score, p2_score, longest_rally, played_at FROM matches "
+            "WHERE mode = ? AND difficulty = ? ORDER BY longest_rally DESC LIMIT ?",
+            (mode, difficulty, limit)
+        )
+
+    def recent(self, limit=5):
+        return self.query(
+            "SELECT mode, difficulty, p1_score, p2_score, longest_rally, played_at FROM matches "
+            "ORDER BY id DESC LIMIT ?", (limit,)
+        )
+
+    def leaderboard(self):
+        # Text rows for the stats screen, each at most 54 columns wide
+        try:
+            totals = self.totals()
+            top = self.top_rallies(5)
+            recent = self.recent(3)
+        except HistoryError as e:
+            return ["", "     Could not read match history:", f"     {e}"]
+
+        lines = []
+        if self.pending and self.error is not None:
+            lines.append(f"     {len(self.pending)} match(es) not saved yet, retrying:")
+            lines.append(f"     {self.error}")
+        if not totals:
+            return lines + ["", "     No matches played yet."]
+
+        lines.append("     Mode Level      Games  P1 wins  P2 wins   Best")
+        for mode, difficulty, matches, p1_wins, p2_wins, _, best_rally, _ in totals:
+            level = DIFFICULTY_NAMES.get(difficulty, str(difficulty))
+            lines.append(f"     {mode:<4} {level:<6} {matches:>9} {p1_wins:>8} {p2_wins:>8} {best_rally:>6}")
+
+        lines.append("")
+        lines.append("     ── Longest Rallies ─────────────────────")
+        for i, (mode, difficulty, p1_score, p2_score, longest_rally, played_at) in enumerate(top, 1):
+            level = DIFFICULTY_NAMES.get(difficulty, str(difficulty))
+            day = time.strftime("%Y-%m-%d", time.localtime(played_at))
+            lines.append(f"     {i}. {longest_rally:>4} hits  {mode} {level:<6} {p1_score:>2}-{p2_score:<2}  {day}")
+
+        lines.append("     ── Recent Matches ──────────────────────")
+        for mode, difficulty, p1_score, p2_score, longest_rally, played_at in recent:
+            level = DIFFICULTY_NAMES.get(difficulty, str(difficulty))
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(played_at))
+            lines.append(f"     {when}  {mode} {level:<6} {p1_score:>2}-{p2_score:<2} {longest_rally:>4} hits")
+        return lines
+
+    def close(self):
+        # Raises HistoryError if queued rows could not be written
+        try:
+            if self.pending:
+                self.flush()
+        finally:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
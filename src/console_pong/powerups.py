@@ -0,0 +1,140 @@
+# Powerup registry
+#
+# Each powerup is a definition with apply/revert hooks. Collecting one
+# creates an ActiveEffect; any number of effects can be active at once for
+# either player, so hooks must adjust state relative to its current value
+# (add/remove a bonus) rather than set absolute values. Expiry is scheduled
+# on a TimerWheel, so the per-tick cost does not grow with the number of
+# running effects.
+
+
+class Powerup:
+    def __init__(self, name, symbol, apply, revert, duration=150):
+        self.name = name
+        self.symbol = symbol
+        self.apply = apply
+        self.revert = revert
+        self.duration = duration
+        self.code = 0
+
+
+class ActiveEffect:
+    __slots__ = ("id", "powerup", "owner", "expires", "timer")
+
+    def __init__(self, id, powerup, owner, expires):
+        self.id = id
+        self.powerup = powerup
+        self.owner = owner
+        self.expires = expires
+        self.timer = None
+
+
+POWERUPS = {}
+POWERUP_NAMES = []
+# Small integer codes for powerups, used by the bot protocol and telemetry
+POWERUP_CODES = {"": 0}
+
+
+def register_powerup(powerup):
+    if powerup.name not in POWERUPS:
+        POWERUP_NAMES.append(powerup.name)
+        powerup.code = len(POWERUP_NAMES)
+    else:
+        powerup.code = POWERUPS[powerup.name].code
+    POWERUPS[powerup.name] = powerup
+    POWERUP_CODES[powerup.name] = powerup.code
+    return powerup
+
+
+# ── Timer Wheel ──────────────────────────────────────────
+
+class TimerWheel:
+    """Hashed timer wheel: schedule, cancel and advance are O(1) per timer."""
+
+    def __init__(self, slots=256):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.slots = [[] for _ in range(slots)]
+        self.mask = slots - 1
+        self.cursor = 0
+
+    def schedule(self, delay, item):
+        # Fires on the delay-th call to advance(). Returns a handle for cancel().
+        delay = max(1, delay)
+        entry = [(delay - 1) // len(self.slots), item]
+        self.slots[(self.cursor + delay) & self.mask].append(entry)
+        return entry
+
+    def cancel(self, entry):
+        entry[1] = None
+
+    def advance(self):
+        self.cursor += 1
+        bucket = self.slots[self.cursor & self.mask]
+        if not bucket:
+            return ()
+
+        expired = []
+        pending = []
+        for entry in bucket:
+            if entry[1] is None:
+                continue
+            if entry[0] == 0:
+                expired.append(entry[1])
+            else:
+                entry[0] -= 1
+                pending.append(entry)
+        bucket[:] = pending
+        return expired
+
+    def clear(self):
+        for bucket in self.slots:
+            bucket.clear()
+
+
+# ── Built-in Powerups ────────────────────────────────────
+
+def _grow(game, player):
+    game.paddle_bonus[player] += 2
+    game.resize_paddles()
+
+
+def _shrink_back(game, player):
+    game.paddle_bonus[player] -= 2
+    game.resize_paddles()
+
+
+def _shrink_opponent(game, player):
+    game.paddle_bonus[3 - player] -= 2
+    game.resize_paddles()
+
+
+def _grow_opponent(game, player):
+    game.paddle_bonus[3 - player] += 2
+    game.resize_paddles()
+
+
+def _speed_up(game, player):
+    game.speed_bonus += 50
+    game.update_ball_speed()
+
+
+def _slow_back(game, player):
+    game.speed_bonus -= 50
+    game.update_ball_speed()
+
+
+def _slow_down(game, player):
+    game.speed_bonus -= 40
+    game.update_ball_speed()
+
+
+def _speed_back(game, player):
+    game.speed_bonus += 40
+    game.update_ball_speed()
+
+
+register_powerup(Powerup("BIG", "⊕", _grow, _shrink_back))
+register_powerup(Powerup("FAST", "⊗", _speed_up, _slow_back))
+register_powerup(Powerup("SLOW", "⊘", _slow_down, _speed_back))
+register_powerup(Powerup("TINY", "⊖", _shrink_opponent, _grow_opponent))
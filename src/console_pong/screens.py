@@ -0,0 +1,129 @@
+# Screen templates
+#
+# The menu, difficulty, leaderboard and game over screens are assembled
+# once, at import. The menu and difficulty screens differ only in the
+# selected row, so every variant is prebuilt; the game over screen is a
+# format template with just its scores and stats left open.
+
+MENU_ITEMS = ("Play vs Player (PVP)", "Play vs CPU", "Leaderboard", "Quit")
+DIFFICULTIES = ("Easy   - CPU is sleepy", "Medium - A fair match", "Hard   - CPU is relentless")
+STATS_ROWS = 18
+
+BOX_TOP = "  ╔══════════════════════════════════════════════════════╗"
+BOX_BLANK = "  ║                                                      ║"
+BOX_BOTTOM = "  ╚══════════════════════════════════════════════════════╝"
+PAD = " " * 60
+
+
+def _menu_frame(selection):
+    lines = [
+        "",
+        BOX_TOP,
+        BOX_BLANK,
+        "  ║     ____    ___   _   _    ____   _                  ║",
+        "  ║    |  _ \\  / _ \\ | \\ | |  / ___| | |                 ║",
+        "  ║    | |_) || | | ||  \\| | | |  _  | |                 ║",
+        "  ║    |  __/ | |_| || |\\  | | |_| | |_|                 ║",
+        "  ║    |_|     \\___/ |_| \\_|  \\____| (_)                 ║",
+        BOX_BLANK,
+        "  ║              ═══ CONSOLE EDITION ═══                 ║",
+        BOX_BLANK,
+    ]
+
+    for i, item in enumerate(MENU_ITEMS):
+        if i == selection:
+            lines.append(f"  ║        ►  {item:<40}  ║")
+        else:
+            lines.append(f"  ║           {item:<40}  ║")
+
+    lines += [
+        BOX_BLANK,
+        "  ║     Controls:                                        ║",
+        "  ║       W/S or I/K  - Move paddle                      ║",
+        "  ║       P - Pause   Q - Quit   R - Restart             ║",
+        "  ║       ↑/↓ or W/S  - Navigate menu                    ║",
+        "  ║       SPACE/ENTER - Select                           ║",
+        BOX_BLANK,
+        "  ║     Features:                                        ║",
+        "  ║       ★ Powerups   ● Ball trails   ◈ Combos          ║",
+        "  ║       ✦ Particles  ⊕ Screen shake                    ║",
+        BOX_BLANK,
+        BOX_BOTTOM,
+        "",
+    ]
+    lines += [PAD] * 4
+    return "\n".join(lines)
+
+
+def _difficulty_frame(selection):
+    lines = [
+        "",
+        BOX_TOP,
+        BOX_BLANK,
+        "  ║              SELECT CPU DIFFICULTY                   ║",
+        BOX_BLANK,
+    ]
+
+    for i, d in enumerate(DIFFICULTIES):
+        if i == selection:
+            lines.append(f"  ║        ►  {d:<42}║")
+        else:
+            lines.append(f"  ║           {d:<42}║")
+
+    lines += [
+        BOX_BLANK,
+        "  ║     W/S to select, SPACE/ENTER to confirm            ║",
+        BOX_BLANK,
+        BOX_BOTTOM,
+    ]
+    lines += [PAD] * 20
+    return "\n".join(lines)
+
+
+def stats_frame(rows):
+    lines = [
+        "",
+        BOX_TOP,
+        BOX_BLANK,
+        "  ║                   ★ LEADERBOARD ★                    ║",
+        BOX_BLANK,
+    ]
+
+    for i in range(STATS_ROWS):
+        text = rows[i] if i < len(rows) else ""
+        lines.append(f"  ║{text[:54]:<54}║")
+
+    lines += [
+        BOX_BLANK,
+        "  ║     [M] Menu    [Q] Quit                             ║",
+        BOX_BLANK,
+        BOX_BOTTOM,
+        "",
+    ]
+    lines += [PAD] * 4
+    return "\n".join(lines)
+
+
+MENU_FRAMES = tuple(_menu_frame(i) for i in range(len(MENU_ITEMS)))
+DIFFICULTY_FRAMES = tuple(_difficulty_frame(i) for i in range(len(DIFFICULTIES)))
+
+GAME_OVER_TEMPLATE = "\n".join([
+    "",
+    BOX_TOP,
+    BOX_BLANK,
+    "  ║                  ★ GAME OVER ★                       ║",
+    BOX_BLANK,
+    "  ║          {winner:^42}  ║",
+    "  ║                    WINS!                             ║",
+    BOX_BLANK,
+    "  ║     Final Score:  P1 [{p1}]  -  [{p2}] {p2label}               ║",
+    BOX_BLANK,
+    "  ║     ── Stats ──────────────────────────              ║",
+    "  ║     Time:          {mins}m {secs:02d}s                            ║",
+    "  ║     Total Rallies: {rallies:<36}║",
+    "  ║     Longest Rally: {longest} hits                              ║",
+    BOX_BLANK,
+    "  ║     [R] Play Again    [M] Menu    [Q] Quit           ║",
+    BOX_BLANK,
+    BOX_BOTTOM,
+] + [PAD] * 12)
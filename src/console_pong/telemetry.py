@@ -0,0 +1,180 @@
+import struct
+import sys
+
+# Event telemetry
+#
+# record() is called from the physics hot path, so it only packs a fixed
+# layout record into a preallocated ring buffer. Nothing is formatted or
+# written until flush(), which the main loop calls in the idle time left
+# over at the end of a frame (and once more on shutdown). If the ring wraps
+# before a flush the oldest records are dropped and counted.
+
+EV_PADDLE_HIT = 1
+EV_WALL_BOUNCE = 2
+EV_SCORE = 3
+EV_POWERUP_SPAWN = 4
+EV_POWERUP_COLLECT = 5
+EV_POWERUP_EXPIRE = 6
+
+EVENT_NAMES = {
+    EV_PADDLE_HIT: "paddle_hit",
+    EV_WALL_BOUNCE: "wall_bounce",
+    EV_SCORE: "score",
+    EV_POWERUP_SPAWN: "powerup_spawn",
+    EV_POWERUP_COLLECT: "powerup_collect",
+    EV_POWERUP_EXPIRE: "powerup_expire",
+}
+
+# In-memory record layout: kind, player, tick, x, y, value. "value" holds
+# the rally length for hits and scores, the powerup code for powerup events
+# and the new vertical velocity for wall bounces.
+RECORD = struct.Struct("<Bb6xQddd")
+RECORD_SIZE = RECORD.size
+
+# Exported columns: name, array typecode
+COLUMNS = (
+    ("kind", "B"),
+    ("tick", "Q"),
+    ("player", "b"),
+    ("x", "d"),
+    ("y", "d"),
+    ("value", "d"),
+)
+
+COLUMNAR_MAGIC = b"PTEL"
+COLUMNAR_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBB")
+BLOCK_HEADER = struct.Struct("<I")
+
+
+class Telemetry:
+    def __init__(self, sink, capacity=4096):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self.sink = sink
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.buf = bytearray(RECORD.size * capacity)
+        self.view = memoryview(self.buf)
+        self._pack_into = RECORD.pack_into
+        self.head = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def record(self, kind, tick, player, x, y, value):
+        self._pack_into(self.buf, (self.head & self.mask) * RECORD_SIZE, kind, player, tick, x, y, value)
+        self.head += 1
+
+    def pending(self):
+        return self.head - self.flushed
+
+    def should_flush(self):
+        # Flush in bulk: wait until a good chunk of the ring is used
+        return self.head - self.flushed >= self.capacity // 4
+
+    def flush(self):
+        count = self.head - self.flushed
+        if count <= 0:
+            return 0
+        if count > self.capacity:
+            self.dropped += count - self.capacity
+            self.flushed = self.head - self.capacity
+            count = self.capacity
+
+        start = self.flushed & self.mask
+        end = start + count
+        if end <= self.capacity:
+            self._write(start, end)
+        else:
+            self._write(start, self.capacity)
+            self._write(0, end - self.capacity)
+        self.flushed = self.head
+        return count
+
+    def _write(self, start, end):
+        from array import array
+        # Transpose the records into columns
+        kind, player, tick, x, y, value = zip(*RECORD.iter_unpack(self.view[start * RECORD_SIZE:end * RECORD_SIZE]))
+        self.sink.write_block([
+            array("B", kind),
+            array("Q", tick),
+            array("b", player),
+            array("d", x),
+            array("d", y),
+            array("d", value),
+        ])
+
+    def close(self):
+        self.flush()
+        self.sink.close()
+
+
+# ── Sinks ────────────────────────────────────────────────
+
+class NdjsonSink:
+    def __init__(self, path):
+        import json
+        self.dumps = json.dumps
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write_block(self, columns):
+        lines = []
+        for kind, tick, player, x, y, value in zip(*columns):
+            lines.append(self.dumps({
+                "event": EVENT_NAMES.get(kind, kind),
+                "tick": tick,
+                "player": player,
+                "x": x,
+                "y": y,
+                "value": value,
+            }))
+        lines.append("")
+        self.file.write("\n".join(lines))
+
+    def close(self):
+        self.file.close()
+
+
+class ColumnarSink:
+    # File: header, then blocks of (record count, each column's raw bytes).
+    # Columns are stored in native byte order, recorded in the header.
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        byteorder = 0 if sys.byteorder == "little" else 1
+        self.file.write(FILE_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, byteorder))
+
+    def write_block(self, columns):
+        self.file.write(BLOCK_HEADER.pack(len(columns[0])))
+        for column in columns:
+            column.tofile(self.file)
+
+    def close(self):
+        self.file.close()
+
+
+def open_sink(path):
+    if path.endswith((".ndjson", ".jsonl", ".json")):
+        return NdjsonSink(path)
+    return ColumnarSink(path)
+
+
+def read_columnar(path):
+    from array import array
+    columns = {name: array(code) for name, code in COLUMNS}
+    with open(path, "rb") as f:
+        magic, version, byteorder = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+        if magic != COLUMNAR_MAGIC or version != COLUMNAR_VERSION:
+            raise ValueError(f"{path} is not a telemetry file")
+        swap = byteorder != (0 if sys.byteorder == "little" else 1)
+        while True:
+            header = f.read(BLOCK_HEADER.size)
+            if len(header) < BLOCK_HEADER.size:
+                break
+            (count,) = BLOCK_HEADER.unpack(header)
+            for name, code in COLUMNS:
+                block = array(code)
+                block.fromfile(f, count)
+                if swap:
+                    block.byteswap()
+                columns[name].extend(block)
+    return columns
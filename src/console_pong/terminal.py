@@ -0,0 +1,67 @@
+import os
+import sys
+
+# Platform terminal backends
+#
+# Only imported once the game actually takes over the terminal, so that
+# importing the package (headless runs, tools, bots) never pays for the
+# platform modules.
+
+WINDOWS = os.name == 'nt'
+
+
+class PosixTerminal:
+    def __init__(self):
+        import select
+        import termios
+        import tty
+        self.select = select.select
+        self.termios = termios
+        self.old_settings = termios.tcgetattr(sys.stdin)
+        tty.setcbreak(sys.stdin.fileno())
+
+    def restore(self):
+        if self.old_settings is not None:
+            self.termios.tcsetattr(sys.stdin, self.termios.TCSADRAIN, self.old_settings)
+            self.old_settings = None
+
+    def get_key(self):
+        if self.select([sys.stdin], [], [], 0)[0]:
+            ch = sys.stdin.read(1)
+            return ch.lower()
+        return None
+
+    def clear(self):
+        # Same as clear(1), without starting a process for it
+        sys.stdout.write('\033[H\033[2J\033[3J')
+        sys.stdout.flush()
+
+
+class WindowsTerminal:
+    def __init__(self):
+        import msvcrt
+        self.msvcrt = msvcrt
+
+    def restore(self):
+        pass
+
+    def get_key(self):
+        msvcrt = self.msvcrt
+        if msvcrt.kbhit():
+            ch = msvcrt.getch()
+            if ch in (b'\x00', b'\xe0'):
+                msvcrt.getch()
+                return None
+            try:
+                return ch.decode('utf-8').lower()
+            except:
+                return None
+        return None
+
+    def clear(self):
+        # cls also turns on escape sequence handling in the console
+        os.system('cls')
+
+
+def open_terminal():
+    return WindowsTerminal() if WINDOWS else PosixTerminal()